@@ -1,5 +1,3 @@
-import re
-
 from ..constants import STRAND
 from ..interval import Interval
 
@@ -11,9 +9,26 @@ class ReferenceName(str):
     Example:
         >>> ReferenceName('chr1') == ReferenceName('1')
         True
+
+    Note:
+        the same few reference names are used by every breakpoint and gene so instances are
+        interned, constructing a name that has been seen before returns the existing instance
     """
 
+    _interned = {}
+
+    def __new__(cls, name=''):
+        name = str(name)
+        try:
+            return cls._interned[(cls, name)]
+        except KeyError:
+            instance = str.__new__(cls, name)
+            cls._interned[(cls, name)] = instance
+            return instance
+
     def __eq__(self, other):
+        if other is self:
+            return True
         options = {str(self)}
         if self.startswith('chr'):
             options.add(str(self[3:]))
@@ -25,7 +40,7 @@ class ReferenceName(str):
         return not self.__eq__(other)
 
     def __hash__(self):
-        return hash(re.sub('^chr', '', str(self)))
+        return hash(str(self[3:]) if self.startswith('chr') else str(self))
 
     def __lt__(self, other):
         self_std_repr = self if not self.startswith('chr') else self[3:]
@@ -150,22 +165,23 @@ class BioInterval:
                 return self.strand
         except AttributeError:
             pass
-        tried = set()
+        # keyed by identity, hashing an annotation object hashes all of its parents
+        tried = {}
         parent = self.reference_object
         while True:
-            if parent in tried:
+            if id(parent) in tried:
                 break
             try:
                 if parent.strand is not None:
                     return parent.strand
             except AttributeError:
                 pass
-            tried.add(parent)
+            tried[id(parent)] = parent
             try:
                 parent = parent.reference_object
             except AttributeError:
                 break
-        raise AttributeError('strand has not been defined', self, self.strand, tried)
+        raise AttributeError('strand has not been defined', self, self.strand, list(tried.values()))
 
     @property
     def is_reverse(self):
@@ -174,9 +190,10 @@ class BioInterval:
         Raises:
             AttributeError: if the strand is not specified
         """
-        if self.get_strand() == STRAND.NEG:
+        strand = self.get_strand()
+        if strand == STRAND.NEG:
             return True
-        elif self.get_strand() == STRAND.POS:
+        elif strand == STRAND.POS:
             return False
         else:
             raise AttributeError('strand has not been defined', self)
@@ -386,6 +386,10 @@ def load_reference_genome(*filepaths):
 
     Returns:
         Dict[str,Bio.SeqRecord]: a dictionary representing the sequences in the fasta file
+
+    Note:
+        sequences are uppercased here (once per template) so that consumers do not need to
+        uppercase reference slices themselves
     """
     reference_genome = {}
     for filename in filepaths:
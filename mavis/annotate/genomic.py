@@ -1,5 +1,4 @@
 from copy import copy
-import itertools
 
 from .base import BioInterval, ReferenceName
 from .constants import SPLICE_SITE_TYPE
@@ -320,7 +319,7 @@ class PreTranscript(BioInterval):
         for ex in self.exons:
             if ex.end > self.end or ex.start < self.start:
                 raise AssertionError('exon is outside transcript', self, ex)
-        for e1, e2 in itertools.combinations(self.exons, 2):
+        for e1, e2 in zip(self.exons, self.exons[1:]):
             if Interval.overlaps(e1, e2):
                 raise AttributeError('exons cannot overlap')
 
@@ -499,7 +498,8 @@ class PreTranscript(BioInterval):
             AttributeError: if the strand is not given or the exon does not belong to the transcript
         """
         for i, current_exon in enumerate(self.exons):
-            if exon != current_exon:
+            # compare the start first since comparing keys recurses through the reference objects
+            if exon.start != current_exon.start or exon != current_exon:
                 continue
             if self.get_strand() == STRAND.POS:
                 return i + 1
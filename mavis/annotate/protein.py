@@ -1,4 +1,4 @@
-import itertools
+import operator
 
 from .base import BioInterval
 from ..constants import CODON_SIZE, START_AA, STOP_AA, translate
@@ -67,7 +67,9 @@ class Domain:
             self.data.update(data)
         if not regions:
             raise AttributeError('at least one region must be given')
-        for region1, region2 in itertools.combinations(self.regions, 2):
+        # once ordered by position, any overlap between regions is also an overlap between neighbours
+        ordered_regions = sorted(self.regions, key=lambda x: (x[0], x[1]))
+        for region1, region2 in zip(ordered_regions, ordered_regions[1:]):
             if Interval.overlaps(region1, region2):
                 raise AttributeError('regions cannot overlap')
 
@@ -181,15 +183,15 @@ class Domain:
 
         results = []
         last_min_end = 0
+        # compare case-insensitively, upper-casing each sequence once rather than per comparison
+        input_sequence = str(input_sequence).upper()
         for seq in seq_list:
             # align the current sequence to find the best matches
             scores = []
             min_match = max(1, int(round(len(seq) * min_region_match, 0)))
+            upper_seq = str(seq).upper()
             for pos in range(last_min_end, len(input_sequence) - len(seq) + 1):
-                score = 0
-                for i in range(0, len(seq)):
-                    if input_sequence[pos + i].upper() == seq[i].upper():
-                        score += 1
+                score = sum(map(operator.eq, input_sequence[pos : pos + len(seq)], upper_seq))
                 if score > min_match:
                     scores.append((Interval(pos + 1, pos + len(seq)), score))
             if not scores:
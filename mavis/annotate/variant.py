@@ -1,3 +1,4 @@
+from functools import lru_cache
 import itertools
 import json
 from shortuuid import uuid
@@ -82,16 +83,35 @@ class Annotation(BreakpointPair):
         Args:
             input_gene (input_gene): the input_gene being added
         """
+        self._add_gene(input_gene)
+        self._filter_proximal_genes()
+
+    def add_genes(self, input_genes):
+        """
+        adds multiple genes to the current set of annotations. Equivalent to calling add_gene for
+        each gene but only filters the proximal genes once all genes have been added
+
+        Args:
+            input_genes (Iterable[Gene]): the genes being added
+        """
+        for input_gene in input_genes:
+            self._add_gene(input_gene)
+        self._filter_proximal_genes()
+
+    def _add_gene(self, input_gene):
         if input_gene.chr not in [self.break1.chr, self.break2.chr]:
             raise AttributeError(
                 'cannot add input_gene not on the same chromosome as either breakpoint'
             )
 
+        # track the classification locally rather than looking the gene back up in the sets
+        categorized = False
         if not self.interchromosomal:
             try:
                 encompassment = Interval(self.break1.end + 1, self.break2.start - 1)
                 if input_gene in encompassment:
                     self.encompassed_genes.add(input_gene)
+                    categorized = True
             except AttributeError:
                 pass
         if (
@@ -100,17 +120,17 @@ class Annotation(BreakpointPair):
             and input_gene != self.transcript1.reference_object
         ):
             self.genes_overlapping_break1.add(input_gene)
+            categorized = True
         if (
             Interval.overlaps(input_gene, self.break2)
             and input_gene.chr == self.break2.chr
             and input_gene != self.transcript2.reference_object
         ):
             self.genes_overlapping_break2.add(input_gene)
+            categorized = True
 
         if (
-            input_gene in self.genes_overlapping_break1
-            or input_gene in self.genes_overlapping_break2
-            or input_gene in self.encompassed_genes
+            categorized
             or input_gene == self.transcript1.reference_object
             or input_gene == self.transcript2.reference_object
         ):
@@ -130,6 +150,10 @@ class Annotation(BreakpointPair):
             if dist2 > 0:
                 self.genes_proximal_to_break2.add((input_gene, dist2))
 
+    def _filter_proximal_genes(self):
+        """
+        keep only the nearest proximal genes or those within the proximity limit if one is given
+        """
         if self.genes_proximal_to_break1:
             temp = set()
             tgt = min([abs(d) for g, d in self.genes_proximal_to_break1])
@@ -270,6 +294,22 @@ def flatten_fusion_translation(translation):
     return row
 
 
+def _common_prefix_length(seq1, seq2):
+    """
+    count the characters aligned consecutively from the start of both sequences
+
+    uses a binary search over slice comparisons rather than comparing one character at a time
+    """
+    low, high = 0, min(len(seq1), len(seq2))
+    while low < high:
+        mid = (low + high + 1) // 2
+        if seq1[low:mid] == seq2[low:mid]:
+            low = mid
+        else:
+            high = mid - 1
+    return low
+
+
 class IndelCall:
     def __init__(self, refseq, mutseq):
         """
@@ -324,15 +364,8 @@ class IndelCall:
                 self.del_seq = self.ref_seq[: 0 - min_len]
                 self.ins_seq = ''
         else:
-            for pos in range(0, min_len):
-                if self.ref_seq[pos] != self.mut_seq[pos]:
-                    break
-                self.nterm_aligned = pos + 1
-
-            for pos in range(0, min_len):
-                if self.ref_seq[-1 - pos] != self.mut_seq[-1 - pos]:
-                    break
-                self.cterm_aligned = pos + 1
+            self.nterm_aligned = _common_prefix_length(self.ref_seq, self.mut_seq)
+            self.cterm_aligned = _common_prefix_length(self.ref_seq[::-1], self.mut_seq[::-1])
 
             if not self.cterm_aligned:
                 self.del_seq = self.ref_seq[self.nterm_aligned :]
@@ -445,6 +478,16 @@ class IndelCall:
         )
 
 
+@lru_cache(maxsize=1024)
+def _protein_indel_notation(ref_aa_seq, mut_aa_seq):
+    """
+    hgvs protein notation (without the reference name) for the indel between two AA sequences. Cached
+    since the same reference translation is compared against every fusion translation and different
+    fusion transcripts frequently produce the same AA sequence
+    """
+    return IndelCall(ref_aa_seq, mut_aa_seq).hgvs_protein_notation()
+
+
 def call_protein_indel(ref_translation, fusion_translation, reference_genome=None):
     """
     compare the fusion protein/aa sequence to the reference protein/aa sequence and
@@ -458,8 +501,7 @@ def call_protein_indel(ref_translation, fusion_translation, reference_genome=Non
         str: the [HGVS](/glossary/#HGVS) protein indel notation
     """
     ref_aa_seq = ref_translation.get_aa_seq(reference_genome)
-    call = IndelCall(ref_aa_seq, fusion_translation.get_aa_seq())
-    notation = call.hgvs_protein_notation()
+    notation = _protein_indel_notation(ref_aa_seq, fusion_translation.get_aa_seq())
     if not notation:
         return None
     name = ref_translation.name
@@ -706,11 +748,9 @@ def _gather_annotations(ref, bp, proximity=None):
 
         a = Annotation(bpp, a1, a2, proximity=proximity)
 
-        for gene in ref.get(bp.break1.chr, []):
-            a.add_gene(gene)
+        a.add_genes(ref.get(bp.break1.chr, []))
         if bp.interchromosomal:
-            for gene in ref.get(bp.break2.chr, []):
-                a.add_gene(gene)
+            a.add_genes(ref.get(bp.break2.chr, []))
         annotations[(a1, a2)] = a
     filtered = (
         []
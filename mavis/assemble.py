@@ -1,4 +1,6 @@
+from collections import Counter
 import itertools
+import sys
 import warnings
 
 import distance
@@ -70,19 +72,21 @@ class DeBruijnGraph(nx.DiGraph):
         """
         returns the freq from the data attribute for a specified edge
         """
-        if not self.has_edge(n1, n2):
+        try:
+            return self.succ[n1][n2]['freq']
+        except KeyError:
             raise KeyError('missing edge', n1, n2)
-        data = self.get_edge_data(n1, n2)
-        return data['freq']
 
     def add_edge(self, n1, n2, freq=1):
         """
         add a given edge to the graph, if it exists add the frequency to the existing frequency count
         """
-        if self.has_edge(n1, n2):
-            data = self.get_edge_data(n1, n2)
-            freq += data['freq']
-        nx.DiGraph.add_edge(self, n1, n2, freq=freq)
+        try:
+            # the edge data is shared between the successor and predecessor adjacency so it
+            # can be updated in place without re-adding the edge
+            self.succ[n1][n2]['freq'] += freq
+        except KeyError:
+            nx.DiGraph.add_edge(self, n1, n2, freq=freq)
 
     def all_edges(self, *nodes, data=False):
         return self.in_edges(*nodes, data=data) + self.out_edges(*nodes, data=data)
@@ -94,18 +98,19 @@ class DeBruijnGraph(nx.DiGraph):
         Args:
             min_weight (int): the minimum weight for an edge to be retained
         """
-        ends = sorted(
-            [n for n in self.nodes() if self.out_degree(n) == 0 or self.in_degree(n) == 0]
-        )
+        succ = self.succ
+        pred = self.pred
+        # check the adjacency dicts directly rather than computing the degree for every node
+        ends = sorted([n for n in succ if not succ[n] or not pred[n]])
         visited = set()
 
         while ends:
             curr = ends.pop()
-            if not self.has_node(curr) or curr in visited:
+            if curr in visited or curr not in succ:
                 continue
             visited.add(curr)
             # follow until the path forks or we run out of low weigh edges
-            if self.out_degree(curr) == 0 or self.in_degree(curr) == 0:
+            if not succ[curr] or not pred[curr]:
                 for src, tgt, data in list(self.all_edges(curr, data=True)):
                     if data['freq'] < min_weight:
                         self.remove_edge(src, tgt)
@@ -116,9 +121,7 @@ class DeBruijnGraph(nx.DiGraph):
 
         # remove any resulting singlets
         for node in visited:
-            if not self.has_node(node):
-                continue
-            if self.degree(node) == 0:
+            if node in succ and not succ[node] and not pred[node]:
                 self.remove_node(node)
 
     def trim_forks_by_freq(self, min_weight):
@@ -220,22 +223,85 @@ def digraph_connected_components(graph, subgraph=None):
     this means there is no difference between connected components
     in a simple graph and a digraph
 
+    Components are found with a union-find over the edges of the input graph rather than
+    copying it into an undirected graph
+
     Args:
         graph (networkx.DiGraph): the input graph to gather components from
+        subgraph (Iterable): the nodes to restrict the components to
 
     Returns:
-        List[List]: returns a list of compnents which are lists of node names
+        List[Set]: returns a list of components which are sets of node names
+
+    Example:
+        >>> graph = DeBruijnGraph()
+        >>> graph.add_edge(1, 2)
+        >>> graph.add_edge(3, 2)
+        >>> graph.add_edge(4, 5)
+        >>> [sorted(c) for c in digraph_connected_components(graph)]
+        [[1, 2, 3], [4, 5]]
     """
     if subgraph is None:
-        subgraph = set(graph.nodes())
-    g = nx.Graph()
+        subgraph = graph.nodes()
+    subgraph = set(subgraph)
+    parent = {node: node for node in graph.nodes() if node in subgraph}
+    size = {node: 1 for node in parent}
+
+    def find(node):
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]  # path halving
+            node = parent[node]
+        return node
+
     for src, tgt in graph.edges():
-        if src in subgraph and tgt in subgraph:
-            g.add_edge(src, tgt)
-    for node in subgraph:
-        if graph.has_node(node):
-            g.add_node(node)
-    return nx.connected_components(g)
+        if src not in parent or tgt not in parent:
+            continue
+        src, tgt = find(src), find(tgt)
+        if src == tgt:
+            continue
+        if size[src] < size[tgt]:
+            src, tgt = tgt, src
+        parent[tgt] = src
+        size[src] += size[tgt]
+
+    components = {}
+    for node in parent:
+        components.setdefault(find(node), set()).add(node)
+    return list(components.values())
+
+
+def digraph_cyclic_nodes(graph):
+    """
+    finds the nodes which cannot be placed in a topological ordering of the graph. Uses a
+    single pass of Kahn's algorithm over the full graph so that each component does not need
+    to be copied and checked separately
+
+    Args:
+        graph (networkx.DiGraph): the input graph
+
+    Returns:
+        Set: the nodes which are part of or downstream of a cycle
+
+    Example:
+        >>> graph = DeBruijnGraph()
+        >>> graph.add_edge(1, 2)
+        >>> graph.add_edge(2, 3)
+        >>> graph.add_edge(3, 2)
+        >>> graph.add_edge(3, 4)
+        >>> graph.add_edge(5, 6)
+        >>> sorted(digraph_cyclic_nodes(graph))
+        [2, 3, 4]
+    """
+    in_degree = {node: len(preds) for node, preds in graph.pred.items()}
+    queue = [node for node, degree in in_degree.items() if degree == 0]
+    while queue:
+        node = queue.pop()
+        del in_degree[node]
+        for child in graph.succ[node]:
+            in_degree[child] -= 1
+            if in_degree[child] == 0:
+                queue.append(child)
+    return set(in_degree)
 
 
 def pull_contigs_from_component(
@@ -291,18 +357,49 @@ def pull_contigs_from_component(
 
             unresolved_components.extend(digraph_connected_components(assembly, component))
         else:
-            for source, sink in itertools.product(
-                assembly.get_sources(component), assembly.get_sinks(component)
-            ):
-                for path in nx.all_simple_paths(assembly, source, sink):
-                    s = path[0] + ''.join([p[-1] for p in path[1:]])
-                    score = 0
-                    for i in range(0, len(path) - 1):
-                        score += assembly.get_edge_freq(path[i], path[i + 1])
+            for source in assembly.get_sources(component):
+                for s, score in _paths_to_sinks(assembly, source):
                     path_scores[s] = max(path_scores.get(s, 0), score)
     return path_scores
 
 
+def _paths_to_sinks(assembly, source):
+    """
+    walks all paths from a source node to the sinks reachable from it. The assembly graph must be
+    acyclic. This is a single depth-first traversal per source rather than one per source and sink
+    pair (as nx.all_simple_paths would be) and the scores and sequences are built as the path is
+    extended rather than re-walking each path
+
+    Args:
+        assembly (DeBruijnGraph): the acyclic assembly graph
+        source: the node to start from
+
+    Returns:
+        Iterable[Tuple[str,int]]: the sequence of each path and the sum of its edge frequencies
+    """
+    path = [source]
+    seq = [source]  # the source node followed by the last character of each subsequent node
+    scores = [0]
+    children = [iter(assembly.successors(source))]
+    while children:
+        child = next(children[-1], None)
+        if child is None:
+            children.pop()
+            path.pop()
+            seq.pop()
+            scores.pop()
+            continue
+        score = scores[-1] + assembly.get_edge_freq(path[-1], child)
+        grandchildren = list(assembly.successors(child))
+        if not grandchildren:
+            yield ''.join(seq) + child[-1], score
+        else:
+            path.append(child)
+            seq.append(child[-1])
+            scores.append(score)
+            children.append(iter(grandchildren))
+
+
 def filter_contigs(contigs, assembly_min_uniq=0.01):
     """
     given a list of contigs, removes similar contigs to leave the highest (of the similar) scoring contig only
@@ -379,25 +476,24 @@ def assemble(
 
     if kwargs:
         raise TypeError('unrecognized keyword argument(s)', kwargs)
-    assembly = DeBruijnGraph()
+    # count the kmers first so that each distinct edge is only added to the graph once
+    kmer_freq = Counter()
     for s in sequences:
         if len(s) < kmer_size:
             continue
-        kmers_list = kmers(s, kmer_size)
-        for kmer in kmers_list:
-            assembly.add_edge(kmer[:-1], kmer[1:])
-    # use the ab min edge weight to remove all low weight edges first
-    nodes = list(assembly.nodes())
-    for n in nodes:
-        if assembly.in_degree(n) == 0 and assembly.out_degree(n) == 0:
-            assembly.remove_node(n)
+        kmer_freq.update(kmers(s, kmer_size))
+    assembly = DeBruijnGraph()
+    for kmer, freq in kmer_freq.items():
+        # intern the nodes since each is shared by several kmers and used as a key throughout
+        assembly.add_edge(sys.intern(kmer[:-1]), sys.intern(kmer[1:]), freq)
+    # every node was added by an edge so there are no singlets to remove here
     # drop all cyclic components
-    for component in digraph_connected_components(assembly):
-        subgraph = assembly.subgraph(component)
-        if not nx.is_directed_acyclic_graph(subgraph):
-            log('dropping cyclic component', time_stamp=False)
-            for node in subgraph.nodes():
-                assembly.remove_node(node)
+    cyclic_nodes = digraph_cyclic_nodes(assembly)
+    if cyclic_nodes:
+        for component in digraph_connected_components(assembly):
+            if not component.isdisjoint(cyclic_nodes):
+                log('dropping cyclic component', time_stamp=False)
+                assembly.remove_nodes_from(component)
     # initial data cleaning
     assembly.trim_forks_by_freq(min_edge_trim_weight)
     assembly.trim_tails_by_freq(min_edge_trim_weight)
@@ -431,9 +527,18 @@ def assemble(
     contigs = filter_contigs(contigs, assembly_min_uniq)
     log('remapping reads to {} contigs'.format(len(contigs)))
 
+    # nsb_align only tries alignments seeded by an exact match of remap_min_exact_match so
+    # contigs sharing no such kmer with the input sequence cannot align and can be skipped
+    contig_seeds = {}
+    if remap_min_exact_match > 1:
+        contig_seeds = {contig: set(kmers(contig.seq, remap_min_exact_match)) for contig in contigs}
+
     for input_seq in sequences:
         maps_to = {}  # contig, score
+        seeds = set(kmers(input_seq, remap_min_exact_match)) if contig_seeds else None
         for contig in contigs:
+            if seeds is not None and contig_seeds[contig].isdisjoint(seeds):
+                continue
             alignment = nsb_align(
                 contig.seq,
                 input_seq,
@@ -480,9 +585,4 @@ def kmers(s, size):
         >>> kmers('abcdef', 2)
         ['ab', 'bc', 'cd', 'de', 'ef']
     """
-    kmers = []
-    for i in range(0, len(s)):
-        if i + size > len(s):
-            break
-        kmers.append(s[i : i + size])
-    return kmers
+    return [s[i : i + size] for i in range(0, len(s) - size + 1)]
@@ -54,19 +54,14 @@ class BamCache:
             return
         if not isinstance(read, SamRead):
             read = SamRead.copy(read)
-        self.cache.setdefault(read.query_name, set())
-        if read not in self.cache[read.query_name]:
-            self.cache[read.query_name].add(read)
+        # set.add keeps the existing read when an equal one is already cached
+        self.cache.setdefault(read.query_name, set()).add(read)
 
     def has_read(self, read):
         """
         checks if a read query name exists in the current cache
         """
-        if read.query_name not in self.cache:
-            return False
-        elif read in self.cache[read.query_name]:
-            return True
-        return False
+        return read in self.cache.get(read.query_name, ())
 
     def reference_id(self, chrom):
         """
@@ -104,21 +99,17 @@ class BamCache:
         """
         assert min_bin_size > 0
         length = stop - start + 1
-        bin_sizes = []
         if sample_bins * min_bin_size > length:
             sample_bins = max([1, length // min_bin_size])
-        s = length // sample_bins  # base size
-        bin_sizes = [s for i in range(0, sample_bins)]
-        remainder = (length - sum(bin_sizes)) // sample_bins
-        bin_sizes = [b + remainder for b in bin_sizes]
-        unsplittable_remainder = length - sum(bin_sizes)
-        for i in range(0, unsplittable_remainder):
-            bin_sizes[i] += 1
-        fetch_regions = [(start, start + bin_sizes[0] - 1)]
-        for b in bin_sizes[1:]:
-            last_end = fetch_regions[-1][1]
-            fetch_regions.append((last_end + 1, last_end + b))
-        return [Interval(s, t) for s, t in fetch_regions]
+        # the first (length % sample_bins) bins take one extra position each
+        base_size, remainder = divmod(length, sample_bins)
+        fetch_regions = []
+        bin_start = start
+        for i in range(0, sample_bins):
+            bin_end = bin_start + base_size + (i < remainder) - 1
+            fetch_regions.append(Interval(bin_start, bin_end))
+            bin_start = bin_end + 1
+        return fetch_regions
 
     def fetch(
         self,
@@ -4,13 +4,36 @@ an iterable list of tuples where the first element in each tuple is the
 CIGAR value (i.e. 1 for an insertion), and the second value is the frequency
 """
 import re
-from ..constants import CIGAR, DNA_ALPHABET, GAP
+
+from Bio.Data.IUPACData import ambiguous_dna_values
+import numpy as np
+
+from ..constants import CIGAR, GAP
 
 EVENT_STATES = {CIGAR.D, CIGAR.I, CIGAR.X}
 ALIGNED_STATES = {CIGAR.M, CIGAR.X, CIGAR.EQ}
 REFERENCE_ALIGNED_STATES = ALIGNED_STATES | {CIGAR.D, CIGAR.N}
 QUERY_ALIGNED_STATES = ALIGNED_STATES | {CIGAR.I, CIGAR.S}
 CLIPPING_STATE = {CIGAR.S, CIGAR.H}
+INDEL_STATES = {CIGAR.I, CIGAR.D}
+ANCHOR_STATES = {CIGAR.EQ, CIGAR.M}
+UNSCORED_STATES = {CIGAR.S, CIGAR.N}
+
+
+def _dna_match_table():
+    """
+    Returns:
+        numpy.ndarray: boolean lookup of DNA_ALPHABET.match for every pair of ascii characters
+    """
+    bases = [set(ambiguous_dna_values.get(chr(i).upper(), chr(i).upper())) for i in range(128)]
+    table = np.zeros((len(bases), len(bases)), dtype=bool)
+    for i, xset in enumerate(bases):
+        for j, yset in enumerate(bases):
+            table[i, j] = not xset.isdisjoint(yset)
+    return table
+
+
+_DNA_MATCH_TABLE = _dna_match_table()
 
 
 def recompute_cigar_mismatch(read, ref):
@@ -26,26 +49,37 @@ def recompute_cigar_mismatch(read, ref):
         List[Tuple[int,int]]: the cigar tuple
     """
     result = []
-    offset = 0
 
     ref_pos = read.reference_start
     seq_pos = 0
+    query_sequence = read.query_sequence
 
     for cigar_value, freq in read.cigar:
         if cigar_value in ALIGNED_STATES:
-            for offset in range(0, freq):
-                if DNA_ALPHABET.match(ref[ref_pos], read.query_sequence[seq_pos]):
-                    if len(result) == 0 or result[-1][0] != CIGAR.EQ:
-                        result.append((CIGAR.EQ, 1))
-                    else:
-                        result[-1] = (CIGAR.EQ, result[-1][1] + 1)
+            if not freq:
+                continue
+            # slice the aligned block once, indexing a Bio Seq/SeqRecord builds a new object per base
+            ref_seq = ref[ref_pos : ref_pos + freq]
+            ref_seq = str(getattr(ref_seq, 'seq', ref_seq))
+            query_seq = query_sequence[seq_pos : seq_pos + freq]
+            if len(ref_seq) < freq or len(query_seq) < freq:
+                raise IndexError(
+                    'aligned block extends past the end of the sequence', ref_pos, freq
+                )
+            # compare the whole block at once and then split it into runs of matches/mismatches
+            matches = _DNA_MATCH_TABLE[
+                np.frombuffer(ref_seq.encode('ascii'), dtype=np.uint8),
+                np.frombuffer(query_seq.encode('ascii'), dtype=np.uint8),
+            ]
+            run_starts = [0] + (np.flatnonzero(matches[1:] != matches[:-1]) + 1).tolist()
+            for run_start, run_end in zip(run_starts, run_starts[1:] + [freq]):
+                state = CIGAR.EQ if matches[run_start] else CIGAR.X
+                if result and result[-1][0] == state:
+                    result[-1] = (state, result[-1][1] + run_end - run_start)
                 else:
-                    if len(result) == 0 or result[-1][0] != CIGAR.X:
-                        result.append((CIGAR.X, 1))
-                    else:
-                        result[-1] = (CIGAR.X, result[-1][1] + 1)
-                ref_pos += 1
-                seq_pos += 1
+                    result.append((state, run_end - run_start))
+            ref_pos += freq
+            seq_pos += freq
             continue
         if cigar_value in QUERY_ALIGNED_STATES:
             seq_pos += freq
@@ -66,20 +100,20 @@ def longest_fuzzy_match(cigar, max_fuzzy_interupt=1):
 
     """
     temp = join(cigar)
+    exact_match = CIGAR.EQ  # read once, each CIGAR.EQ access goes through the namespace lookup
     longest_fuzzy_match = 0
-    for pos, c in enumerate(temp):
-        if c[0] != CIGAR.EQ:
+    for pos, (state, freq) in enumerate(temp):
+        if state != exact_match:
             continue
-        current_fuzzy_match = c[1]
-        pos += 1
+        current_fuzzy_match = freq
         fuzzy_count = 0
-        while pos < len(temp) and fuzzy_count <= max_fuzzy_interupt:
-            v, f = temp[pos]
-            if v != CIGAR.EQ:
+        for next_state, next_freq in temp[pos + 1 :]:
+            if fuzzy_count > max_fuzzy_interupt:
+                break
+            if next_state != exact_match:
                 fuzzy_count += 1
             else:
-                current_fuzzy_match += f
-            pos += 1
+                current_fuzzy_match += next_freq
         if current_fuzzy_match > longest_fuzzy_match:
             longest_fuzzy_match = current_fuzzy_match
     return longest_fuzzy_match
@@ -115,14 +149,13 @@ def score(cigar, **kwargs):
     gap_extend = kwargs.pop('GAP_EXTEND', -1)
 
     score = 0
+    per_base_score = {CIGAR.EQ: match, CIGAR.X: mismatch}
     for v, freq in cigar:
-        if v == CIGAR.EQ:
-            score += match * freq
-        elif v == CIGAR.X:
-            score += mismatch * freq
-        elif v in [CIGAR.I, CIGAR.D]:
+        if v in per_base_score:
+            score += per_base_score[v] * freq
+        elif v in INDEL_STATES:
             score += gap + gap_extend * (freq - 1)
-        elif v in [CIGAR.S, CIGAR.N]:
+        elif v in UNSCORED_STATES:
             pass
         else:
             raise AssertionError('unexpected cigar value', v)
@@ -133,17 +166,16 @@ def match_percent(cigar):
     """
     calculates the percent of aligned bases (matches or mismatches) that are matches
     """
-    matches = 0
-    mismatches = 0
+    counts = {CIGAR.EQ: 0, CIGAR.X: 0}
     for v, f in cigar:
-        if v == CIGAR.EQ:
-            matches += f
-        elif v == CIGAR.X:
-            mismatches += f
-        elif v == CIGAR.M:
+        if v in counts:
+            counts[v] += f
+        elif v in ALIGNED_STATES:  # M, the only aligned state which is not specific
             raise AttributeError(
                 'cannot calculate match percent with non-specific alignments', cigar
             )
+    matches = counts[CIGAR.EQ]
+    mismatches = counts[CIGAR.X]
     if matches + mismatches == 0:
         raise AttributeError('input cigar str does not have any aligned sections (X or =)', cigar)
     else:
@@ -187,7 +219,7 @@ def extend_softclipping(cigar, min_exact_to_stop_softclipping):
     anchors = [
         i
         for i, (v, f) in enumerate(cigar)
-        if v in {CIGAR.EQ, CIGAR.M} and f >= min_exact_to_stop_softclipping
+        if v in ANCHOR_STATES and f >= min_exact_to_stop_softclipping
     ]
     if not anchors:
         raise AttributeError('cannot compute on this cigar as there is no stop point')
@@ -226,19 +258,20 @@ def compute(ref, alt, force_softclipping=True, min_exact_to_stop_softclipping=6)
 
     if len(ref) != len(alt):
         raise AttributeError('ref and alt must be the same length')
+    # classify all the aligned columns at once and then collapse them into runs
+    ref_bytes = np.frombuffer(str(ref).encode('ascii'), dtype=np.uint8)
+    alt_bytes = np.frombuffer(str(alt).encode('ascii'), dtype=np.uint8)
+    ref_gaps = ref_bytes == ord(GAP)
+    alt_gaps = alt_bytes == ord(GAP)
+    states = np.where(_DNA_MATCH_TABLE[ref_bytes, alt_bytes], CIGAR.EQ, CIGAR.X)
+    states[ref_gaps] = CIGAR.I
+    states[alt_gaps] = CIGAR.D
+    states = states[~(ref_gaps & alt_gaps)]
     cigar = []
-    for r, a in zip(ref, alt):
-        if r == a and r == GAP:
-            pass
-        elif r == GAP:
-            cigar.append((CIGAR.I, 1))
-        elif a == GAP:
-            cigar.append((CIGAR.D, 1))
-        elif DNA_ALPHABET.match(r, a):
-            cigar.append((CIGAR.EQ, 1))
-        else:
-            cigar.append((CIGAR.X, 1))
-    cigar = join(cigar)
+    if states.size:
+        run_starts = [0] + (np.flatnonzero(states[1:] != states[:-1]) + 1).tolist()
+        for run_start, run_end in zip(run_starts, run_starts[1:] + [states.size]):
+            cigar.append((int(states[run_start]), run_end - run_start))
 
     try:
         c, rs = extend_softclipping(cigar, min_exact_to_stop_softclipping)
@@ -255,11 +288,8 @@ def convert_for_igv(cigar):
         >>> convert_for_igv([(7, 4), (8, 1), (7, 5)])
         [(0, 10)]
     """
-    result = []
-    for v, f in cigar:
-        if v in ALIGNED_STATES:
-            v = CIGAR.M
-        result.append((v, f))
+    aligned = CIGAR.M
+    result = [(aligned if v in ALIGNED_STATES else v, f) for v, f in cigar]
     return join(result)
 
 
@@ -465,7 +495,7 @@ def merge_internal_events(cigar, inner_anchor=10, outer_anchor=10):
     # get the initial anchors
     exact_match_pos = []
     for i, tup in enumerate(read_cigar):
-        if tup[0] in [CIGAR.EQ, CIGAR.M] and tup[1] >= outer_anchor:
+        if tup[0] in ANCHOR_STATES and tup[1] >= outer_anchor:
             exact_match_pos.append((i, tup[1]))
 
     if len(exact_match_pos) < 2:
@@ -481,7 +511,7 @@ def merge_internal_events(cigar, inner_anchor=10, outer_anchor=10):
         last_state, last_value = new_cigar[-1]
 
         if state == CIGAR.X:
-            if last_state in EVENT_STATES - {CIGAR.X}:  # any event that is not a mismatch
+            if last_state in INDEL_STATES:  # any event that is not a mismatch
                 new_cigar.extend([(CIGAR.I, count), (CIGAR.D, count)])
             else:
                 new_cigar.append((state, count))
@@ -502,13 +532,13 @@ def merge_internal_events(cigar, inner_anchor=10, outer_anchor=10):
                 temp = new_cigar[last_event:]
                 new_cigar = new_cigar[:last_event]
                 for new_state, new_count in temp:
-                    if new_state in {CIGAR.EQ, CIGAR.M, CIGAR.X}:
+                    if new_state in ALIGNED_STATES:
                         new_cigar.extend([(CIGAR.D, new_count), (CIGAR.I, new_count)])
                     else:
                         new_cigar.append((new_state, new_count))
             new_cigar.append((state, count))
-        elif state in [CIGAR.EQ, CIGAR.M]:
-            if count >= inner_anchor or last_state not in EVENT_STATES - {CIGAR.X}:
+        elif state in ANCHOR_STATES:
+            if count >= inner_anchor or last_state not in INDEL_STATES:
                 new_cigar.append((state, count))
             else:
                 if last_state == CIGAR.X:
@@ -1,6 +1,5 @@
 from copy import copy
 import itertools
-import re
 import subprocess
 
 import pysam
@@ -290,6 +289,23 @@ def calculate_alignment_score(read, consec_bonus=1):
     return score / max_score
 
 
+def _find_non_overlapping(substring, string):
+    """
+    positions of the non-overlapping occurrences of a substring. Equivalent to the start positions
+    from re.finditer for a literal pattern but without compiling a new pattern for every substring
+
+    Example:
+        >>> _find_non_overlapping('AA', 'AAAAB')
+        [0, 2]
+    """
+    positions = []
+    pos = string.find(substring)
+    while pos >= 0:
+        positions.append(pos)
+        pos = string.find(substring, pos + len(substring))
+    return positions
+
+
 def nsb_align(
     ref,
     seq,
@@ -349,7 +365,7 @@ def nsb_align(
             if current_kmer in kmers_checked:
                 putative_start_positions.update([p - i for p in kmers_checked[current_kmer]])
                 continue
-            rp = [m.start() for m in re.finditer(current_kmer, ref)]
+            rp = _find_non_overlapping(current_kmer, ref)
             kmers_checked[current_kmer] = rp
             putative_start_positions.update([p - i for p in rp])
     for ref_start in putative_start_positions:
@@ -365,7 +381,8 @@ def nsb_align(
                 cigar.append((CIGAR.S, 1))
                 length -= 1
                 continue
-            if DNA_ALPHABET.match(ref[r], seq[i]):
+            # identical bases always match so only check ambiguous matching when they differ
+            if ref[r] == seq[i] or DNA_ALPHABET.match(ref[r], seq[i]):
                 cigar.append((CIGAR.EQ, 1))
             else:
                 cigar.append((CIGAR.X, 1))
@@ -400,6 +417,24 @@ def nsb_align(
     return filtered
 
 
+def tag_value(read, tag, default=None):
+    """
+    get the value of a tag in a single lookup rather than checking has_tag first
+
+    Args:
+        read (pysam.AlignedSegment): the read to get the tag from
+        tag (str): the name of the tag
+        default: value to return if the read does not have the tag
+
+    Returns:
+        the value of the tag or the default if the tag is not set
+    """
+    try:
+        return read.get_tag(tag)
+    except KeyError:
+        return default
+
+
 def sequenced_strand(read, strand_determining_read=2):
     """
     determines the strand that was sequenced
@@ -51,6 +51,11 @@ class BamStats:
         return result
 
 
+def _squared_error(value, expected):
+    diff = value - expected
+    return diff * diff
+
+
 class Histogram(dict):
     def add(self, item, freq=1):
         """
@@ -75,7 +80,7 @@ class Histogram(dict):
             center = len(values) // 2 + 1
             return values[center - 1]
 
-    def distribution_stderr(self, median, fraction, error_function=lambda x, y: math.pow(x - y, 2)):
+    def distribution_stderr(self, median, fraction, error_function=_squared_error):
         values = []
         for val, freq in self.items():
             err = error_function(val, median)
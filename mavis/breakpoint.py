@@ -1,6 +1,7 @@
 from __future__ import division
 from copy import copy as _copy
 
+from .annotate.base import ReferenceName
 from .constants import CIGAR, COLUMNS, DNA_ALPHABET, ORIENT, reverse_complement, STRAND, SVTYPE
 from .error import InvalidRearrangement, NotSpecifiedError
 from .interval import Interval
@@ -32,8 +33,6 @@ class Breakpoint(Interval):
             >>> Breakpoint('1', 1, 2, 'R', )
             >>> Breakpoint('1', 1, orient='R')
         """
-        from .annotate.base import ReferenceName
-
         Interval.__init__(self, start, end)
         self.orient = ORIENT.enforce(orient)
         self.chr = ReferenceName(chr)
@@ -256,7 +256,12 @@ class MavisNamespace:
             Traceback (most recent call last):
             ....
         """
-        if value not in self.values():
+        # use is_env_overwritable rather than the stored set since subclasses may override it
+        if any(self.is_env_overwritable(attr) for attr in self._members):
+            values = self.values()
+        else:  # no values can be overridden so skip resolving each value through the namespace
+            values = self._members.values()
+        if value not in values:
             raise KeyError('value {0} is not a valid member of '.format(repr(value)), self.values())
         return value
 
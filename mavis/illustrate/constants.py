@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from colour import Color
 from ..constants import GIEMSA_STAIN, float_fraction
 from ..util import WeakMavisNamespace
@@ -61,6 +63,15 @@ DEFAULTS.add(
 )
 
 
+@lru_cache(maxsize=None)
+def _color_range(start, end, steps):
+    """
+    Returns:
+        Tuple[str]: hex codes for the gradient of colors from the start to the end color
+    """
+    return tuple(c.hex for c in Color(start).range_to(Color(end), steps))
+
+
 class DiagramSettings:
     """
     holds settings related to colors/sizes for the drawing
@@ -111,9 +122,9 @@ class DiagramSettings:
         self.domain_scaffold_height = 1
         self.domain_label_prefix = 'D'
         self.domain_label_font_size = 20
-        self.domain_fill_gradient = [
-            c.hex for c in Color(self.domain_mismatch_color).range_to(Color(self.domain_color), 10)
-        ]
+        self.domain_fill_gradient = list(
+            _color_range(self.domain_mismatch_color, self.domain_color, 10)
+        )
         self.domain_links = {r'^PF\d+$': 'http://pfam.xfam.org/family/{.name}'}
 
         self.splice_height = self.track_height / 2
@@ -170,7 +181,7 @@ class DiagramSettings:
         self.legend_border_stroke_width = 1
 
         self.template_band_stroke_width = 0.5
-        temp = [c.hex for c in Color('#ffffff').range_to(Color('#000000'), 7)]
+        temp = _color_range('#ffffff', '#000000', 7)
         self.template_band_fill = {
             GIEMSA_STAIN.ACEN: '#800000',
             GIEMSA_STAIN.GPOS25: temp[1],
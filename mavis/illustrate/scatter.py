@@ -1,3 +1,4 @@
+import math
 import os
 
 from ..bam.read import sequenced_strand, pileup
@@ -141,17 +142,25 @@ def draw_scatter(ds, canvas, plot, xmapping, log=DEVNULL):
 
     yratio = plot.height / (abs(plot.ymax - plot.ymin))
     px_points = []
-    circles = []
+    centers = []
     for x_pos, y_pos in plot.points:
         try:
             x_px = Interval.convert_ratioed_pos(xmapping, x_pos, forward_to_reverse=False)
             y_px = Interval(plot.height - abs(min(y_pos, plot.ymax) - plot.ymin) * yratio)
-            current_circle = sPoint(x_px.center, y_px.center).buffer(ds.scatter_marker_radius)
-            if circles:
-                ratio = circles[-1].intersection(current_circle).area / current_circle.area
+            center = (x_px.center, y_px.center)
+            if centers:
+                ratio = 0
+                # only build the marker shapes when they are close enough to overlap
+                if (
+                    math.hypot(center[0] - centers[-1][0], center[1] - centers[-1][1])
+                    < ds.scatter_marker_radius * 2
+                ):
+                    previous_circle = sPoint(*centers[-1]).buffer(ds.scatter_marker_radius)
+                    current_circle = sPoint(*center).buffer(ds.scatter_marker_radius)
+                    ratio = previous_circle.intersection(current_circle).area / current_circle.area
                 if ratio > plot.density:
                     continue
-            circles.append(current_circle)
+            centers.append(center)
             px_points.append(
                 (
                     x_px,
@@ -164,7 +173,7 @@ def draw_scatter(ds, canvas, plot, xmapping, log=DEVNULL):
         except IndexError:
             pass
     log(
-        'drew {} of {} points (density={})'.format(len(circles), len(plot.points), plot.density),
+        'drew {} of {} points (density={})'.format(len(centers), len(plot.points), plot.density),
         time_stamp=False,
     )
 
@@ -1,3 +1,7 @@
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+import heapq
+
 from colour import Color
 import svgwrite
 
@@ -8,9 +12,13 @@ from ..interval import Interval, IntervalMapping
 MIN_PIXEL_ACCURACY = 1
 
 
+@lru_cache(maxsize=None)
 def dynamic_label_color(color):
     """
     calculates the luminance of a color and determines if a black or white label will be more contrasting
+
+    Note:
+        diagrams reuse a small set of colors for many elements so the result is cached by color
     """
     color = Color(color)
     if color.get_luminance() < 0.5:
@@ -22,6 +30,8 @@ class LabelMapping:
     def __init__(self, **kwargs):
         self._mapping = dict()
         self._reverse_mapping = dict()
+        # next number to try for each prefix. Keys are never removed so lower numbers stay taken
+        self._next_index = dict()
         for attr, val in kwargs.items():
             self[attr] = val
 
@@ -61,32 +71,43 @@ class LabelMapping:
     def add(self, value, prefix=''):
         if value in self._reverse_mapping:
             return self._reverse_mapping[value]
-        i = 1
+        i = self._next_index.get(prefix, 1)
         while True:
             key = '{}{}'.format(prefix, i)
             if key not in self._mapping:
                 self[key] = value
                 break
             i += 1
+        self._next_index[prefix] = i + 1
         return self._reverse_mapping[value]
 
 
 def split_intervals_into_tracks(intervals):
+    """
+    packs the intervals into tracks of non-overlapping intervals. Each interval is added to the
+    first track it does not overlap
+
+    Since the intervals are added in order of their start position, an interval only overlaps a
+    track if it starts before the end of the last interval in that track. The tracks are swept
+    with a heap of the track ends and a heap of the tracks which are free at the current start
+
+    Example:
+        >>> split_intervals_into_tracks([(1, 3), (3, 7), (2, 2), (4, 5), (3, 10)])
+        [[(1, 3), (4, 5)], [(2, 2), (3, 7)], [(3, 10)]]
+    """
     tracks = [[]]
+    track_ends = []  # (end, track index) of the tracks which may still overlap the next interval
+    free_tracks = [0]  # tracks which no longer overlap any of the remaining intervals
     for itvl in sorted(intervals, key=lambda x: x[0]):
-        added = False
-        for track in tracks:
-            overlaps = False
-            for track_itvl in track:
-                if Interval.overlaps(itvl, track_itvl):
-                    overlaps = True
-                    break
-            if not overlaps:
-                added = True
-                track.append(itvl)
-                break
-        if not added:
-            tracks.append([itvl])
+        while track_ends and track_ends[0][0] < itvl[0]:
+            heapq.heappush(free_tracks, heapq.heappop(track_ends)[1])
+        if free_tracks:
+            index = heapq.heappop(free_tracks)
+        else:
+            index = len(tracks)
+            tracks.append([])
+        tracks[index].append(itvl)
+        heapq.heappush(track_ends, (itvl[1], index))
     return tracks
 
 
@@ -129,15 +150,17 @@ def generate_interval_mapping(
         if len(itvl_in) == 1:
             intervals.append(itvl_in)
     # now split any intervals by start/end
+    # sort the input positions once so the positions within each interval can be found by bisection
+    input_starts = sorted([ii.start for ii in input_intervals])
+    input_ends = sorted([ii.end for ii in input_intervals])
     breaks = {}
     for i in intervals:
         # split by input intervals
         breaks[i] = set([i.start, i.end])
-        for ii in input_intervals:
-            if ii.start >= i.start and ii.start <= i.end:
-                breaks[i].add(ii.start)
-            if ii.end >= i.start and ii.end <= i.end:
-                breaks[i].add(ii.end)
+        for positions in [input_starts, input_ends]:
+            breaks[i].update(
+                positions[bisect_left(positions, i.start) : bisect_right(positions, i.end)]
+            )
     temp = []
     for itvl, breakpoints in breaks.items():
         breakpoints.add(itvl.start)
@@ -241,9 +264,10 @@ def generate_interval_mapping(
             min_pixel_accuracy,
         )
     mapping = {k: v for k, v in mapping}
+    input_positions = {(ii.start, ii.end) for ii in input_intervals}
     # assert that that mapping is correct
     for ifrom, ito in mapping.items():
-        if ifrom not in input_intervals:
+        if (ifrom.start, ifrom.end) not in input_positions:
             continue
         if (
             ito.length() < min_width and abs(ito.length() - min_width) > min_pixel_accuracy
@@ -1,6 +1,12 @@
+from bisect import bisect_right
+
+
 class Interval:
     """"""
 
+    # forward_to_reverse is only set on intervals returned by convert_ratioed_pos
+    __slots__ = ('start', 'end', 'freq', 'number_type', 'forward_to_reverse')
+
     def __init__(self, start, end=None, freq=1, number_type=None):
         """
         Args:
@@ -81,6 +87,11 @@ class Interval:
         return (self - other) + (other - self)
 
     def __getitem__(self, index):
+        # intervals are indexed constantly when compared so check the expected indices first
+        if index == 0:
+            return self.start
+        elif index == 1:
+            return self.end
         try:
             index = int(index)
         except ValueError:
@@ -442,6 +453,24 @@ class IntervalMapping:
                 )
         for i in self.mapping:
             self.opposing_directions.setdefault(i, False)
+        self._source_starts = None  # sorted source intervals for lookups, built on first use
+        self._source_intervals = None
+
+    def _find_source_interval(self, pos):
+        """
+        find the source interval containing the position. Since the source intervals do not
+        overlap, only the interval with the last start at or before the position can contain it
+
+        Raises:
+            IndexError: if the input position is not in any of the mapped intervals
+        """
+        if self._source_starts is None:
+            self._source_intervals = sorted(self.mapping, key=lambda x: x.start)
+            self._source_starts = [i.start for i in self._source_intervals]
+        index = bisect_right(self._source_starts, pos) - 1
+        if index >= 0 and pos in self._source_intervals[index]:
+            return self._source_intervals[index]
+        raise IndexError(pos, 'position not found in mapping', self.mapping.keys())
 
     def keys(self):
         return self.mapping.keys()
@@ -457,6 +486,8 @@ class IntervalMapping:
                 raise ValueError('source intervals in mapping must not overlap')
         self.mapping[src_interval] = tgt_interval
         self.opposing_directions[src_interval] = opposing_directions
+        self._source_starts = None
+        self._source_intervals = None
 
     def convert_ratioed_pos(self, pos):
         """convert any given position given a mapping of intervals to another range
@@ -479,20 +510,17 @@ class IntervalMapping:
             >>> mapping.convert_pos(15)
             559
         """
-        for src_interval, tgt_interval in self.mapping.items():
-            if pos in src_interval:
-                if src_interval.length() > 0:
-                    ratio = tgt_interval.length() / src_interval.length()
-                    shift = (pos - src_interval.start) * ratio
-                    if self.opposing_directions[src_interval]:
-                        return Interval(tgt_interval.end - shift - ratio, tgt_interval.end - shift)
-                    else:
-                        return Interval(
-                            tgt_interval.start + shift, tgt_interval.start + shift + ratio
-                        )
-                else:
-                    return tgt_interval
-        raise IndexError(pos, 'position not found in mapping', self.mapping.keys())
+        src_interval = self._find_source_interval(pos)
+        tgt_interval = self.mapping[src_interval]
+        if src_interval.length() > 0:
+            ratio = tgt_interval.length() / src_interval.length()
+            shift = (pos - src_interval.start) * ratio
+            if self.opposing_directions[src_interval]:
+                return Interval(tgt_interval.end - shift - ratio, tgt_interval.end - shift)
+            else:
+                return Interval(tgt_interval.start + shift, tgt_interval.start + shift + ratio)
+        else:
+            return tgt_interval
 
     def convert_pos(self, pos):
         """convert any given position given a mapping of intervals to another range
@@ -515,15 +543,14 @@ class IntervalMapping:
             >>> mapping.convert_pos(15)
             559
         """
-        for src_interval, tgt_interval in self.mapping.items():
-            if pos in src_interval:
-                if src_interval.length() > 0:
-                    ratio = tgt_interval.length() / src_interval.length()
-                    shift = (pos - src_interval.start) * ratio
-                    if self.opposing_directions[src_interval]:
-                        return int(round(tgt_interval.end - shift, 0))
-                    else:
-                        return int(round(tgt_interval.start + shift, 0))
-                else:
-                    return int(round(tgt_interval.start, 0))
-        raise IndexError(pos, 'position not found in mapping', self.mapping.keys())
+        src_interval = self._find_source_interval(pos)
+        tgt_interval = self.mapping[src_interval]
+        if src_interval.length() > 0:
+            ratio = tgt_interval.length() / src_interval.length()
+            shift = (pos - src_interval.start) * ratio
+            if self.opposing_directions[src_interval]:
+                return int(round(tgt_interval.end - shift, 0))
+            else:
+                return int(round(tgt_interval.start + shift, 0))
+        else:
+            return int(round(tgt_interval.start, 0))
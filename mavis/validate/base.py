@@ -1,6 +1,7 @@
 import itertools
 import logging
 from .constants import DEFAULTS
+from ..align import call_read_events
 from ..assemble import assemble
 from ..bam import cigar as _cigar
 from ..bam import read as _read
@@ -153,6 +154,9 @@ class Evidence(BreakpointPair):
         self.contigs = []
 
         self.half_mapped = (set(), set())
+        self._fragment_sizes = {}  # memoized fragment size ranges by read pair
+        self._read_events = {}  # memoized events called from the alignment of a read
+        self._pair_positions = {}  # memoized fragment size and alignment positions by read pair
 
         try:
             self.compute_fragment_size(None, None)
@@ -238,6 +242,69 @@ class Evidence(BreakpointPair):
         """
         raise NotImplementedError('abstract method must be overridden')
 
+    def fragment_size(self, read, mate):
+        """
+        memoized version of compute_fragment_size. The same read pairs are checked against every
+        event call made from this evidence so the fragment size range is only computed once per pair
+
+        Args:
+            read (pysam.AlignedSegment):
+            mate (pysam.AlignedSegment):
+        Returns:
+            Interval: interval representing the range of possible fragment sizes for this read pair
+        """
+        try:
+            return self._fragment_sizes[(read, mate)]
+        except KeyError:
+            fragment_size = self.compute_fragment_size(read, mate)
+            self._fragment_sizes[(read, mate)] = fragment_size
+            return fragment_size
+
+    def pair_positions(self, read, mate):
+        """
+        memoized fragment size range and alignment positions for a read pair. Flanking pairs are
+        filtered for every event call made from this evidence so the values are read from the
+        alignments once and stored as a plain row which can be stacked directly into an array
+
+        Args:
+            read (pysam.AlignedSegment):
+            mate (pysam.AlignedSegment):
+        Returns:
+            Tuple[int,int,int,int,int,int,bool]: the start and end of the fragment size range, the read start and end, the mate start and end, and whether the pair is interchromosomal
+        """
+        try:
+            return self._pair_positions[(read, mate)]
+        except KeyError:
+            fragment = self.fragment_size(read, mate)
+            positions = (
+                fragment.start,
+                fragment.end,
+                read.reference_start,
+                read.reference_end,
+                mate.reference_start,
+                mate.reference_end,
+                read.reference_id != mate.reference_id,
+            )
+            self._pair_positions[(read, mate)] = positions
+            return positions
+
+    def read_events(self, read):
+        """
+        memoized version of call_read_events for this evidence. Spanning reads are compared against
+        every putative call so the events are only parsed from the cigar once per read
+
+        Args:
+            read (pysam.AlignedSegment): the read to call events from
+        Returns:
+            List[SplitAlignment]: the events called from the read (shared, copy before modifying)
+        """
+        try:
+            return self._read_events[read]
+        except KeyError:
+            events = call_read_events(read, is_stranded=self.bam_cache.stranded)
+            self._read_events[read] = events
+            return events
+
     def supporting_reads(self):
         """
         convenience method to return all flanking, split and spanning reads associated with an evidence object
@@ -281,9 +348,7 @@ class Evidence(BreakpointPair):
 
         if Interval.overlaps(combined, read_interval):
 
-            if not read.has_tag(PYSAM_READ_FLAGS.RECOMPUTED_CIGAR) or not read.get_tag(
-                PYSAM_READ_FLAGS.RECOMPUTED_CIGAR
-            ):
+            if not _read.tag_value(read, PYSAM_READ_FLAGS.RECOMPUTED_CIGAR):
 
                 read = self.standardize_read(read)
             # in the correct position, now determine if it can support the event types
@@ -342,13 +407,9 @@ class Evidence(BreakpointPair):
             or mate.mapping_quality < self.min_mapping_quality
         ):
             return False
-        if not read.has_tag(PYSAM_READ_FLAGS.RECOMPUTED_CIGAR) or not read.get_tag(
-            PYSAM_READ_FLAGS.RECOMPUTED_CIGAR
-        ):
+        if not _read.tag_value(read, PYSAM_READ_FLAGS.RECOMPUTED_CIGAR):
             read = self.standardize_read(read)
-        if not mate.has_tag(PYSAM_READ_FLAGS.RECOMPUTED_CIGAR) or not mate.get_tag(
-            PYSAM_READ_FLAGS.RECOMPUTED_CIGAR
-        ):
+        if not _read.tag_value(mate, PYSAM_READ_FLAGS.RECOMPUTED_CIGAR):
             mate = self.standardize_read(mate)
         # order the read pairs so that they are in the same order that we expect for the breakpoints
         if read.reference_start > mate.reference_start:
@@ -375,7 +436,7 @@ class Evidence(BreakpointPair):
             return False
 
         # check that the fragment size is reasonable
-        fragment_size = self.compute_fragment_size(read, mate)
+        fragment_size = self.fragment_size(read, mate)
 
         if compatible_type == SVTYPE.DEL:
             if fragment_size.end <= self.max_expected_fragment_size:
@@ -437,13 +498,9 @@ class Evidence(BreakpointPair):
         elif read.reference_id != read.next_reference_id:
             return False
 
-        if not read.has_tag(PYSAM_READ_FLAGS.RECOMPUTED_CIGAR) or not read.get_tag(
-            PYSAM_READ_FLAGS.RECOMPUTED_CIGAR
-        ):
+        if not _read.tag_value(read, PYSAM_READ_FLAGS.RECOMPUTED_CIGAR):
             read = self.standardize_read(read)
-        if not mate.has_tag(PYSAM_READ_FLAGS.RECOMPUTED_CIGAR) or not mate.get_tag(
-            PYSAM_READ_FLAGS.RECOMPUTED_CIGAR
-        ):
+        if not _read.tag_value(mate, PYSAM_READ_FLAGS.RECOMPUTED_CIGAR):
             mate = self.standardize_read(mate)
         # order the read pairs so that they are in the same order that we expect for the breakpoints
         if read.reference_id != mate.reference_id:
@@ -486,7 +543,7 @@ class Evidence(BreakpointPair):
                 continue
 
             # check that the fragment size is reasonable
-            fragment_size = self.compute_fragment_size(read, mate)
+            fragment_size = self.fragment_size(read, mate)
 
             if event_type == SVTYPE.DEL:
                 if fragment_size.end <= self.max_expected_fragment_size:
@@ -607,9 +664,7 @@ class Evidence(BreakpointPair):
         if len(primary) < self.min_anchor_exact or len(clipped) < self.min_softclipping:
             # split read does not meet the minimum anchor criteria
             return False
-        if not read.has_tag(PYSAM_READ_FLAGS.RECOMPUTED_CIGAR) or not read.get_tag(
-            PYSAM_READ_FLAGS.RECOMPUTED_CIGAR
-        ):
+        if not _read.tag_value(read, PYSAM_READ_FLAGS.RECOMPUTED_CIGAR):
             read = self.standardize_read(read)
         # data quality filters
         if (
@@ -804,9 +859,7 @@ class Evidence(BreakpointPair):
             self.spanning_reads
         ):
             # ignore targeted realignments
-            if read.has_tag(PYSAM_READ_FLAGS.TARGETED_ALIGNMENT) and read.get_tag(
-                PYSAM_READ_FLAGS.TARGETED_ALIGNMENT
-            ):
+            if _read.tag_value(read, PYSAM_READ_FLAGS.TARGETED_ALIGNMENT):
                 continue
             assembly_sequences.setdefault(read.query_sequence, set()).add(read)
             rqs_comp = reverse_complement(read.query_sequence)
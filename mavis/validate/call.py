@@ -1,8 +1,9 @@
+from bisect import bisect_left, bisect_right
 import itertools
-import math
-import statistics
 
-from ..align import SplitAlignment, call_read_events, call_paired_read_event, convert_to_duplication
+import numpy as np
+
+from ..align import SplitAlignment, call_paired_read_event, convert_to_duplication
 from ..bam import read as _read
 
 from ..breakpoint import Breakpoint, BreakpointPair
@@ -18,6 +19,17 @@ from ..constants import (
 from ..interval import Interval
 
 
+def _join_names(names):
+    """
+    joins read names for a tabbed file column
+
+    Example:
+        >>> _join_names({'b', 'a'})
+        'a;b'
+    """
+    return ';'.join(sorted(names))
+
+
 class EventCall(BreakpointPair):
     """
     class for holding evidence and the related calls since we can't freeze the evidence object
@@ -73,10 +85,10 @@ class EventCall(BreakpointPair):
         else:
             self.compatible_type = None
         # use the distance function from the source evidence to narrow the possible types
+        # (the classification does not depend on the event type so only needs to be computed once)
         putative_types = BreakpointPair.classify(self, source_evidence.distance)
         if event_type not in putative_types and self.compatible_type in putative_types:
             event_type, self.compatible_type = self.compatible_type, event_type
-            putative_types = BreakpointPair.classify(self, source_evidence.distance)
 
         self.event_type = SVTYPE.enforce(event_type)
         if event_type not in putative_types | {self.compatible_type}:
@@ -99,6 +111,7 @@ class EventCall(BreakpointPair):
             self.utemp_shift = self.untemplated_shift(source_evidence.reference_genome)
         except AttributeError:  # non-specific breakpoint calls
             self.utemp_shift = (0, 0)
+        self._flanking_filters = {}  # is_compatible => filter for the flanking pairs
 
     def get_bed_repesentation(self):
         bed = []
@@ -142,7 +155,7 @@ class EventCall(BreakpointPair):
         """return a set of all reads which support the call"""
         support = set()
         support.update(self.spanning_reads)
-        for read, mate in self.flanking_pairs | self.compatible_flanking_pairs:
+        for read, mate in itertools.chain(self.flanking_pairs, self.compatible_flanking_pairs):
             support.add(read)
             support.add(mate)
         support.update(self.break1_split_reads)
@@ -185,73 +198,117 @@ class EventCall(BreakpointPair):
         Note:
             see [theory - determining flanking support](/background/theory/#determining-flanking-support)
         """
-        min_frag = max(
-            [
-                self.source_evidence.min_expected_fragment_size
-                + Interval.dist(self.break1, self.break2),
-                self.source_evidence.max_expected_fragment_size,
-            ]
+        flanking_pairs = list(flanking_pairs)
+        if not flanking_pairs:
+            return
+        pair_positions = self.source_evidence.pair_positions
+        rows = [pair_positions(read, mate) for read, mate in flanking_pairs]
+        (
+            frag_start,
+            frag_end,
+            read_start,
+            read_end,
+            mate_start,
+            mate_end,
+            interchromosomal,
+        ) = np.array(rows, dtype=np.int64).T
+
+        mask = self._flanking_filter(is_compatible)(
+            frag_start, frag_end, read_start, read_end, mate_start, mate_end, interchromosomal
         )
-        max_frag = len(self.break1 | self.break2) + self.source_evidence.max_expected_fragment_size
 
-        for read, mate in flanking_pairs:
-            # check that the fragment size is reasonable
-            fragment_size = self.source_evidence.compute_fragment_size(read, mate)
-            if self.event_type == SVTYPE.DEL:
-                if fragment_size.end < min_frag or fragment_size.start > max_frag:
-                    continue
-            elif self.event_type == SVTYPE.INS:
-                if fragment_size.start >= self.source_evidence.min_expected_fragment_size:
-                    continue
-            if self.interchromosomal != (read.reference_id != mate.reference_id):
-                continue
+        event_type = self.event_type if not is_compatible else self.compatible_type
+        supporting_pairs = self.compatible_flanking_pairs if is_compatible else self.flanking_pairs
+        for index in np.flatnonzero(mask):
+            read, mate = flanking_pairs[index]
             # check that the flanking reads work with the current call
-            if not _read.orientation_supports_type(
-                read, self.event_type if not is_compatible else self.compatible_type
-            ):
-                continue
-            # check that the positions make sense
-            left = ORIENT.LEFT if not is_compatible else ORIENT.RIGHT
-            if self.break1.orient == left:
-                if self.break2.orient == left:  # L L
-                    if not all(
-                        [
-                            read.reference_start + 1 <= self.break1.end,
-                            mate.reference_start + 1 <= self.break2.end,
-                            mate.reference_end > self.break1.start or self.interchromosomal,
-                        ]
-                    ):
-                        continue
-                else:  # L R
-                    if not all(
-                        [
-                            read.reference_start + 1 <= self.break1.end,
-                            mate.reference_end >= self.break2.start,
-                        ]
-                    ):
-                        continue
-            else:
-                if self.break2.orient == left:  # R L
-                    if not all(
-                        [
-                            read.reference_end >= self.break1.start,
-                            mate.reference_start + 1 <= self.break2.end,
-                        ]
-                    ):
-                        continue
-                else:  # R R
-                    if not all(
-                        [
-                            read.reference_end >= self.break1.start,
-                            mate.reference_end >= self.break2.start,
-                            read.reference_end < self.break2.end or self.interchromosomal,
-                        ]
-                    ):
-                        continue
-            if is_compatible:
-                self.compatible_flanking_pairs.add((read, mate))
+            if _read.orientation_supports_type(read, event_type):
+                supporting_pairs.add((read, mate))
+
+    def _flanking_filter(self, is_compatible=False):
+        """
+        builds the filter for the flanking pairs which support this call. The event type and the
+        breakpoint orientations are fixed for the call so the filter is built once and only has the
+        checks relevant to them
+
+        Args:
+            is_compatible (bool): build the filter for the compatible event type flanking pairs
+
+        Returns:
+            Callable: function of the fragment and read position arrays which returns the boolean mask of supporting pairs
+        """
+        if is_compatible in self._flanking_filters:
+            return self._flanking_filters[is_compatible]
+
+        # check that the fragment size is reasonable
+        if self.event_type == SVTYPE.DEL:
+            min_frag = max(
+                [
+                    self.source_evidence.min_expected_fragment_size
+                    + Interval.dist(self.break1, self.break2),
+                    self.source_evidence.max_expected_fragment_size,
+                ]
+            )
+            max_frag = (
+                len(self.break1 | self.break2) + self.source_evidence.max_expected_fragment_size
+            )
+
+            def fragment_mask(frag_start, frag_end):
+                return (frag_end >= min_frag) & (frag_start <= max_frag)
+
+        elif self.event_type == SVTYPE.INS:
+            min_expected = self.source_evidence.min_expected_fragment_size
+
+            def fragment_mask(frag_start, frag_end):
+                return frag_start < min_expected
+
+        else:
+
+            def fragment_mask(frag_start, frag_end):
+                return True
+
+        # check that the positions make sense. The orientations are fixed for the call so only one
+        # of the position checks applies to all the pairs
+        left = ORIENT.LEFT if not is_compatible else ORIENT.RIGHT
+        if self.break1.orient == left:
+            if self.break2.orient == left:
+                position_mask = self._flanking_position_mask_LL
             else:
-                self.flanking_pairs.add((read, mate))
+                position_mask = self._flanking_position_mask_LR
+        elif self.break2.orient == left:
+            position_mask = self._flanking_position_mask_RL
+        else:
+            position_mask = self._flanking_position_mask_RR
+        call_interchromosomal = self.interchromosomal
+
+        def flanking_filter(
+            frag_start, frag_end, read_start, read_end, mate_start, mate_end, interchromosomal
+        ):
+            mask = (interchromosomal != 0) == call_interchromosomal
+            mask &= fragment_mask(frag_start, frag_end)
+            mask &= position_mask(read_start, read_end, mate_start, mate_end)
+            return mask
+
+        self._flanking_filters[is_compatible] = flanking_filter
+        return flanking_filter
+
+    def _flanking_position_mask_LL(self, read_start, read_end, mate_start, mate_end):
+        mask = (read_start + 1 <= self.break1.end) & (mate_start + 1 <= self.break2.end)
+        if not self.interchromosomal:
+            mask &= mate_end > self.break1.start
+        return mask
+
+    def _flanking_position_mask_LR(self, read_start, read_end, mate_start, mate_end):
+        return (read_start + 1 <= self.break1.end) & (mate_end >= self.break2.start)
+
+    def _flanking_position_mask_RL(self, read_start, read_end, mate_start, mate_end):
+        return (read_end >= self.break1.start) & (mate_start + 1 <= self.break2.end)
+
+    def _flanking_position_mask_RR(self, read_start, read_end, mate_start, mate_end):
+        mask = (read_end >= self.break1.start) & (mate_end >= self.break2.start)
+        if not self.interchromosomal:
+            mask &= read_end < self.break2.end
+        return mask
 
     def add_break1_split_read(self, read):
         """
@@ -288,7 +345,7 @@ class EventCall(BreakpointPair):
         Args:
             read (pysam.AlignedSegment): putative spanning read
         """
-        for event in call_read_events(read, is_stranded=self.source_evidence.bam_cache.stranded):
+        for event in self.source_evidence.read_events(read):
             if event == self and self.event_type in BreakpointPair.classify(
                 event, distance=self.source_evidence.distance
             ):
@@ -311,39 +368,47 @@ class EventCall(BreakpointPair):
         fragment_sizes = []
         for read, mate in self.flanking_pairs:
             # check that the fragment size is reasonable
-            fsize_range = self.source_evidence.compute_fragment_size(read, mate)
+            fsize_range = self.source_evidence.fragment_size(read, mate)
             fragment_sizes.append(fsize_range.start)
             fragment_sizes.append(fsize_range.end)
         median = 0
         stdev = 0
         if fragment_sizes:
-            median = statistics.median(fragment_sizes)
-            err = 0
-            for insert in fragment_sizes:
-                err += math.pow(insert - median, 2)
-            err /= len(fragment_sizes)
-            stdev = math.sqrt(err)
+            fragment_sizes = np.array(fragment_sizes, dtype=np.float64)
+            median = float(np.median(fragment_sizes))
+            stdev = float(np.sqrt(np.mean(np.square(fragment_sizes - median))))
         return median, stdev
 
+    @staticmethod
+    def _split_read_names(reads):
+        """
+        collects the split read names in a single pass over the reads
+
+        Args:
+            reads (Iterable[pysam.AlignedSegment]): split reads for a breakpoint
+
+        Returns:
+            Tuple[Set[str],Set[str]]: the names of the original alignments and the names of the target re-aligned reads
+        """
+        original = set()
+        targeted = set()
+        for read in reads:
+            if _read.tag_value(read, PYSAM_READ_FLAGS.TARGETED_ALIGNMENT):
+                targeted.add(read.query_name)
+            else:
+                original.add(read.query_name)
+        return original, targeted
+
     def break1_split_read_names(self, tgt=False, both=False):
         """
         Args:
             tgt (bool): return only target re-aligned read names
             both (bool): return both original alignments and target-realigned
         """
-        reads = set()
-        for read in self.break1_split_reads:
-            if read.has_tag(PYSAM_READ_FLAGS.TARGETED_ALIGNMENT) and read.get_tag(
-                PYSAM_READ_FLAGS.TARGETED_ALIGNMENT
-            ):
-                if tgt:
-                    reads.add(read.query_name)
-            elif not tgt:
-                reads.add(read.query_name)
-
-            if both:
-                reads.add(read.query_name)
-        return reads
+        original, targeted = self._split_read_names(self.break1_split_reads)
+        if both:
+            return original | targeted
+        return targeted if tgt else original
 
     def break2_split_read_names(self, tgt=False, both=False):
         """
@@ -351,19 +416,10 @@ class EventCall(BreakpointPair):
             tgt (bool): return only target re-aligned read names
             both (bool): return both original alignments and target-realigned
         """
-        reads = set()
-        for read in self.break2_split_reads:
-            if read.has_tag(PYSAM_READ_FLAGS.TARGETED_ALIGNMENT) and read.get_tag(
-                PYSAM_READ_FLAGS.TARGETED_ALIGNMENT
-            ):
-                if tgt:
-                    reads.add(read.query_name)
-            elif not tgt:
-                reads.add(read.query_name)
-
-            if both:
-                reads.add(read.query_name)
-        return reads
+        original, targeted = self._split_read_names(self.break2_split_reads)
+        if both:
+            return original | targeted
+        return targeted if tgt else original
 
     def linking_split_read_names(self):
         return self.break1_split_read_names(both=True) & self.break2_split_read_names(both=True)
@@ -392,33 +448,36 @@ class EventCall(BreakpointPair):
                 event.untemplated_seq,
             )
 
+        # reference sequences are uppercased once per template when loaded (see load_reference_genome)
+        reference_seq = reference_genome[event.break1.chr].seq
         expected_sequence = None
         rightmost = None
         if event.event_type == SVTYPE.DEL:
-            expected_sequence = reference_genome[event.break1.chr].seq[
-                event.break1.start : event.break2.end - 1
-            ]
+            expected_sequence = reference_seq[event.break1.start : event.break2.end - 1]
             rightmost = event.break1.start
         elif event.event_type == SVTYPE.DUP:
-            expected_sequence = reference_genome[event.break1.chr].seq[
-                event.break1.start - 1 : event.break2.end
-            ]
+            expected_sequence = reference_seq[event.break1.start - 1 : event.break2.end]
             rightmost = event.break1.start - 1
         else:
             expected_sequence = event.untemplated_seq
             rightmost = event.break1.start
 
+        # gallop left from the breakpoint comparing blocks of repeats at a time rather than
+        # one repeat unit per iteration. The block size doubles on a match and halves on a mismatch
+        repeat_unit = str(expected_sequence)
         repeat_count = 0
-        while rightmost - len(expected_sequence) > 0 and expected_sequence:
-            ref = (
-                reference_genome[event.break1.chr]
-                .seq[rightmost - len(expected_sequence) : rightmost]
-                .upper()
-            )
-            if ref != expected_sequence:
-                break
-            repeat_count += 1
-            rightmost -= len(expected_sequence)
+        block_count = 1 if repeat_unit else 0
+        while block_count:
+            block_start = rightmost - len(repeat_unit) * block_count
+            if (
+                block_start > 0
+                and str(reference_seq[block_start:rightmost]) == repeat_unit * block_count
+            ):
+                repeat_count += block_count
+                rightmost = block_start
+                block_count *= 2
+            else:
+                block_count //= 2
         return repeat_count, expected_sequence
 
     def flatten(self):
@@ -461,33 +520,37 @@ class EventCall(BreakpointPair):
         median, stdev = self.flanking_metrics()
         flank = set()
         for read, mate in self.flanking_pairs:
-            flank.update({read.query_name, mate.query_name})
+            flank.add(read.query_name)
+            flank.add(mate.query_name)
         row.update(
             {
                 COLUMNS.flanking_pairs: len(self.flanking_pairs),
                 COLUMNS.flanking_median_fragment_size: median,
                 COLUMNS.flanking_stdev_fragment_size: stdev,
-                COLUMNS.flanking_pairs_read_names: ';'.join(sorted(list(flank))),
+                COLUMNS.flanking_pairs_read_names: _join_names(flank),
             }
         )
 
+        break1_original, break1_targeted = self._split_read_names(self.break1_split_reads)
+        break2_original, break2_targeted = self._split_read_names(self.break2_split_reads)
+        break1_names = break1_original | break1_targeted
+        break2_names = break2_original | break2_targeted
+        # sort each side once, the linking names are a subset of either side so filtering keeps the order
+        break1_sorted_names = sorted(break1_names)
+        linking_sorted_names = [name for name in break1_sorted_names if name in break2_names]
         row.update(
             {
-                COLUMNS.break1_split_reads: len(self.break1_split_read_names()),
-                COLUMNS.break1_split_reads_forced: len(self.break1_split_read_names(tgt=True)),
-                COLUMNS.break1_split_read_names: ';'.join(
-                    sorted(self.break1_split_read_names(both=True))
-                ),
-                COLUMNS.break2_split_reads: len(self.break2_split_read_names()),
-                COLUMNS.break2_split_reads_forced: len(self.break2_split_read_names(tgt=True)),
-                COLUMNS.break2_split_read_names: ';'.join(
-                    sorted(self.break2_split_read_names(both=True))
-                ),
-                COLUMNS.linking_split_reads: len(self.linking_split_read_names()),
-                COLUMNS.linking_split_read_names: ';'.join(sorted(self.linking_split_read_names())),
+                COLUMNS.break1_split_reads: len(break1_original),
+                COLUMNS.break1_split_reads_forced: len(break1_targeted),
+                COLUMNS.break1_split_read_names: ';'.join(break1_sorted_names),
+                COLUMNS.break2_split_reads: len(break2_original),
+                COLUMNS.break2_split_reads_forced: len(break2_targeted),
+                COLUMNS.break2_split_read_names: _join_names(break2_names),
+                COLUMNS.linking_split_reads: len(linking_sorted_names),
+                COLUMNS.linking_split_read_names: ';'.join(linking_sorted_names),
                 COLUMNS.spanning_reads: len(self.spanning_reads),
-                COLUMNS.spanning_read_names: ';'.join(
-                    sorted([r.query_name for r in self.spanning_reads])
+                COLUMNS.spanning_read_names: _join_names(
+                    [r.query_name for r in self.spanning_reads]
                 ),
             }
         )
@@ -495,7 +558,7 @@ class EventCall(BreakpointPair):
             row[COLUMNS.flanking_pairs_compatible] = len(self.compatible_flanking_pairs)
             names = {f[0].query_name for f in self.compatible_flanking_pairs}
             names.update({f[1].query_name for f in self.compatible_flanking_pairs})
-            row[COLUMNS.flanking_pairs_compatible_read_names] = ';'.join(sorted(names))
+            row[COLUMNS.flanking_pairs_compatible_read_names] = _join_names(names)
         try:
             row[COLUMNS.net_size] = '{}-{}'.format(*self.net_size(self.source_evidence.distance))
         except ValueError:
@@ -526,8 +589,8 @@ class EventCall(BreakpointPair):
                     COLUMNS.contig_alignment_score: self.contig_alignment.score(),
                     COLUMNS.contig_alignment_rank: self.contig_alignment.alignment_rank().center,
                     COLUMNS.contig_remapped_reads: len(self.contig.input_reads),
-                    COLUMNS.contig_remapped_read_names: ';'.join(
-                        sorted(set([r.query_name for r in self.contig.input_reads]))
+                    COLUMNS.contig_remapped_read_names: _join_names(
+                        {r.query_name for r in self.contig.input_reads}
                     ),
                     COLUMNS.contig_strand_specific: self.contig.strand_specific,
                     COLUMNS.contig_alignment_query_consumption: self.contig_alignment.query_consumption(),
@@ -543,9 +606,92 @@ class EventCall(BreakpointPair):
         return row
 
 
+def index_split_reads_by_breakpoint(reads, orient):
+    """
+    sorts split reads by the position of their breakpoint (1-based) so that the reads supporting
+    a given breakpoint window can be found by binary search. Reads without soft-clipping
+    supporting the orientation are dropped
+
+    Args:
+        reads (Iterable[pysam.AlignedSegment]): the split reads to be indexed
+        orient (ORIENT): the orientation of the breakpoint
+
+    Returns:
+        Tuple[List[int],List[pysam.AlignedSegment]]: the sorted breakpoint positions and the reads in the same order
+    """
+    indexed = []
+    for read in reads:
+        try:
+            indexed.append((_read.breakpoint_pos(read, orient) + 1, read))
+        except AttributeError:
+            pass
+    indexed.sort(key=lambda x: x[0])
+    return [pos for pos, read in indexed], [read for pos, read in indexed]
+
+
 def _call_by_contigs(source_evidence):
     # try calling by contigs
     all_contig_calls = []
+    split_read_index = {}  # (breakpoint, orientation) => sorted breakpoint positions and reads
+
+    def split_reads_in_window(breakpoint_index, orient, start, end):
+        key = (breakpoint_index, orient)
+        if key not in split_read_index:
+            split_read_index[key] = index_split_reads_by_breakpoint(
+                source_evidence.split_reads[breakpoint_index], orient
+            )
+        positions, reads = split_read_index[key]
+        return reads[bisect_left(positions, start) : bisect_right(positions, end)]
+
+    flanking_pairs = source_evidence.flanking_pairs
+    compatible_flanking_pairs = source_evidence.compatible_flanking_pairs
+    spanning_reads = source_evidence.spanning_reads
+    # multiple alignments (or contigs) can call the same event. The support does not depend on the
+    # contig so it is only collected once per distinct call
+    support_by_call = {}
+
+    def add_support(event_call):
+        key = (
+            event_call.break1,
+            event_call.break2,
+            event_call.opposing_strands,
+            event_call.untemplated_seq,
+            event_call.event_type,
+        )
+        if key in support_by_call:
+            supported = support_by_call[key]
+            event_call.flanking_pairs.update(supported.flanking_pairs)
+            event_call.compatible_flanking_pairs.update(supported.compatible_flanking_pairs)
+            event_call.spanning_reads.update(supported.spanning_reads)
+            event_call.break1_split_reads.update(supported.break1_split_reads)
+            event_call.break2_split_reads.update(supported.break2_split_reads)
+            return
+        support_by_call[key] = event_call
+        # add the flanking support
+        event_call.add_flanking_support(flanking_pairs)
+        if event_call.has_compatible:
+            event_call.add_flanking_support(compatible_flanking_pairs, is_compatible=True)
+
+        # add any spanning reads that call the same event
+        for read in spanning_reads:
+            event_call.add_spanning_read(read)
+        # add any split read support (this will be consumed for non-contig calls)
+        for breakpoint_index, (breakpoint, split_reads) in enumerate(
+            [
+                (event_call.break1, event_call.break1_split_reads),
+                (event_call.break2, event_call.break2_split_reads),
+            ]
+        ):
+            shift = event_call.utemp_shift[breakpoint_index]
+            split_reads.update(
+                split_reads_in_window(
+                    breakpoint_index,
+                    breakpoint.orient,
+                    breakpoint.start - shift,
+                    breakpoint.end + shift,
+                )
+            )
+
     for ctg in source_evidence.contigs:
         curr_contig_calls = []
         for aln in ctg.alignments:
@@ -565,22 +711,7 @@ def _call_by_contigs(source_evidence):
                     )
                 except ValueError:
                     continue
-                # add the flanking support
-                new_event.add_flanking_support(source_evidence.flanking_pairs)
-                if new_event.has_compatible:
-                    new_event.add_flanking_support(
-                        source_evidence.compatible_flanking_pairs, is_compatible=True
-                    )
-
-                # add any spanning reads that call the same event
-                for read in source_evidence.spanning_reads:
-                    new_event.add_spanning_read(read)
-                # add any split read support (this will be consumed for non-contig calls)
-                for read in source_evidence.split_reads[0]:
-                    new_event.add_break1_split_read(read)
-                for read in source_evidence.split_reads[1]:
-                    new_event.add_break2_split_read(read)
-
+                add_support(new_event)
                 curr_contig_calls.append(new_event)
         # remove any supplementary calls that are not associated with a target call
         if not all([c.is_supplementary() for c in curr_contig_calls]):
@@ -608,21 +739,85 @@ def filter_consumed_pairs(pairs, consumed_reads):
         >>> filter_consumed_pairs(pairs, consumed_reads)
         {(5, 6)}
     """
-    temp = set()
-    for read, mate in pairs:
-        if read not in consumed_reads and mate not in consumed_reads:
-            temp.add((read, mate))
-    return temp
+    if not consumed_reads:
+        return set(pairs)
+    return {
+        (read, mate)
+        for read, mate in pairs
+        if read not in consumed_reads and mate not in consumed_reads
+    }
+
+
+def index_pairs_by_read(pairs):
+    """
+    creates a mapping from each read to the indices of the pairs it is a member of so that pairs can be
+    marked as consumed along with their reads without re-scanning or re-hashing the full list of pairs
+
+    Args:
+        pairs (List[Tuple[pysam.AlignedSegment,pysam.AlignedSegment]]): pairs to be indexed
+
+    Returns:
+        Dict[pysam.AlignedSegment,List[int]]: indices of the pairs by read
+
+    Example:
+        >>> index_pairs_by_read([(1, 2), (1, 3)])
+        {1: [0, 1], 2: [0], 3: [1]}
+    """
+    pairs_by_read = {}
+    for index, pair in enumerate(pairs):
+        for read in pair:
+            pairs_by_read.setdefault(read, []).append(index)
+    return pairs_by_read
+
+
+def discard_consumed_pairs(available, pairs_by_read, consumed_reads):
+    """
+    marks (in-place) all pairs where either read in the pair is in the consumed set as unavailable.
+    Equivalent to filter_consumed_pairs but only touches the pairs associated with the newly consumed reads
+
+    Args:
+        available (numpy.ndarray): boolean mask of the pairs which have not been consumed
+        pairs_by_read (Dict[pysam.AlignedSegment,List[int]]): see index_pairs_by_read
+        consumed_reads (Iterable[pysam.AlignedSegment]): reads that have been used/consumed
+
+    Example:
+        >>> pairs = [(1, 2), (3, 4), (5, 6)]
+        >>> available = np.ones(len(pairs), dtype=bool)
+        >>> discard_consumed_pairs(available, index_pairs_by_read(pairs), {1, 4})
+        >>> available_pairs(pairs, available)
+        [(5, 6)]
+    """
+    for read in consumed_reads:
+        available[pairs_by_read.get(read, [])] = False
 
 
-def _call_by_spanning_reads(source_evidence, consumed_evidence):
+def available_pairs(pairs, available):
+    """
+    Args:
+        pairs (List[Tuple[pysam.AlignedSegment,pysam.AlignedSegment]]): the indexed pairs
+        available (numpy.ndarray): boolean mask of the pairs which have not been consumed
+
+    Returns:
+        List[Tuple[pysam.AlignedSegment,pysam.AlignedSegment]]: the pairs which have not been consumed
+    """
+    return [pairs[index] for index in np.flatnonzero(available)]
+
+
+def _call_by_spanning_reads(source_evidence, consumed_evidence, available_flanking_pairs=None):
     spanning_calls = {}
-    available_flanking_pairs = filter_consumed_pairs(
-        source_evidence.flanking_pairs, consumed_evidence
+    if available_flanking_pairs is None:
+        available_flanking_pairs = filter_consumed_pairs(
+            source_evidence.flanking_pairs, consumed_evidence
+        )
+    # the consumed evidence does not change here so compute the unconsumed reads once for all calls
+    available_split_reads = (
+        source_evidence.split_reads[0] - consumed_evidence,
+        source_evidence.split_reads[1] - consumed_evidence,
     )
     for read in source_evidence.spanning_reads - consumed_evidence:
-        for event in call_read_events(read, is_stranded=source_evidence.bam_cache.stranded):
-            event = convert_to_duplication(event, source_evidence.reference_genome)
+        for event in source_evidence.read_events(read):
+            # copy since the breakpoint sequences are reset below and the events are cached on the evidence
+            event = convert_to_duplication(event.copy(), source_evidence.reference_genome)
             if all(
                 [
                     event.query_consumption() >= source_evidence.contig_aln_min_query_consumption,
@@ -664,9 +859,9 @@ def _call_by_spanning_reads(source_evidence, consumed_evidence):
             if new_event.has_compatible:
                 new_event.add_flanking_support(available_flanking_pairs, is_compatible=True)
             # add any split read support (this will be consumed for non-contig calls)
-            for read in source_evidence.split_reads[0] - consumed_evidence:
+            for read in available_split_reads[0]:
                 new_event.add_break1_split_read(read)
-            for read in source_evidence.split_reads[1] - consumed_evidence:
+            for read in available_split_reads[1]:
                 new_event.add_break2_split_read(read)
 
             result.append(new_event)
@@ -685,6 +880,65 @@ def _call_by_spanning_reads(source_evidence, consumed_evidence):
     return filtered_events
 
 
+def _call_by_supporting_reads(
+    source_evidence, event_type, consumed_evidence, flanking_pairs, available, pairs_by_read
+):
+    """
+    calls events of a given type by split reads and then by flanking pairs. The input consumed evidence and
+    available flanking pairs are copied and not modified so that calls for different event types are
+    independent of each other
+
+    Args:
+        source_evidence (Evidence): the input evidence
+        event_type (SVTYPE): the type of event to call
+        consumed_evidence (Set[pysam.AlignedSegment]): reads already consumed by other calls
+        flanking_pairs (List[Tuple[pysam.AlignedSegment,pysam.AlignedSegment]]): the indexed flanking pairs
+        available (numpy.ndarray): boolean mask of the flanking pairs which have not been consumed
+        pairs_by_read (Dict[pysam.AlignedSegment,List[int]]): see index_pairs_by_read
+
+    Returns:
+        Tuple[List[EventCall],Set[str]]: the calls and the error messages for calls that could not be made
+    """
+    calls = []
+    errors = set()
+    type_consumed_evidence = set(consumed_evidence)
+    type_available = available.copy()
+
+    for call in _call_by_split_reads(
+        source_evidence,
+        event_type,
+        type_consumed_evidence,
+        available_flanking_pairs=available_pairs(flanking_pairs, type_available),
+    ):
+        support = call.support()
+        type_consumed_evidence.update(support)
+        discard_consumed_pairs(type_available, pairs_by_read, support)
+        calls.append(call)
+
+    try:
+        call = _call_by_flanking_pairs(
+            source_evidence,
+            event_type,
+            type_consumed_evidence,
+            available_flanking_pairs=available_pairs(flanking_pairs, type_available),
+        )
+        if len(call.flanking_pairs) < source_evidence.min_flanking_pairs_resolution:
+            errors.add(
+                'flanking call ({}) failed to supply the minimum evidence required ({} < {})'.format(
+                    event_type,
+                    len(call.flanking_pairs),
+                    source_evidence.min_flanking_pairs_resolution,
+                )
+            )
+        else:
+            calls.append(call)
+    except AssertionError as err:
+        errors.add(str(err))
+    except ValueError:  # incompatible type
+        pass
+    return calls, errors
+
+
 def call_events(source_evidence):
     """
     generates a set of event calls based on the evidence associated with the source_evidence object
@@ -700,13 +954,24 @@ def call_events(source_evidence):
     consumed_evidence = set()  # keep track to minimize evidence re-use
     calls = []
     errors = set()
+    # track the unconsumed flanking pairs by index as reads are consumed rather than re-filtering for each method
+    flanking_pairs = list(source_evidence.flanking_pairs)
+    pairs_by_read = index_pairs_by_read(flanking_pairs)
+    available = np.ones(len(flanking_pairs), dtype=bool)
 
     for call in _call_by_contigs(source_evidence):
         consumed_evidence.update(call.support())
         calls.append(call)
+    discard_consumed_pairs(available, pairs_by_read, consumed_evidence)
 
-    for call in _call_by_spanning_reads(source_evidence, consumed_evidence):
-        consumed_evidence.update(call.support())
+    for call in _call_by_spanning_reads(
+        source_evidence,
+        consumed_evidence,
+        available_flanking_pairs=available_pairs(flanking_pairs, available),
+    ):
+        support = call.support()
+        consumed_evidence.update(support)
+        discard_consumed_pairs(available, pairs_by_read, support)
         calls.append(call)
 
     # for ins/dup check for compatible call as well
@@ -714,31 +979,13 @@ def call_events(source_evidence):
     if putative_types & {SVTYPE.INS, SVTYPE.DUP}:
         putative_types.update({SVTYPE.INS, SVTYPE.DUP})
 
+    # calls by split/flanking reads for each type only read the shared evidence state so are independent
     for event_type in sorted(putative_types):
-        # try calling by split/flanking reads
-        type_consumed_evidence = set()
-        type_consumed_evidence.update(consumed_evidence)
-
-        for call in _call_by_split_reads(source_evidence, event_type, type_consumed_evidence):
-            type_consumed_evidence.update(call.support())
-            calls.append(call)
-
-        try:
-            call = _call_by_flanking_pairs(source_evidence, event_type, type_consumed_evidence)
-            if len(call.flanking_pairs) < source_evidence.min_flanking_pairs_resolution:
-                errors.add(
-                    'flanking call ({}) failed to supply the minimum evidence required ({} < {})'.format(
-                        event_type,
-                        len(call.flanking_pairs),
-                        source_evidence.min_flanking_pairs_resolution,
-                    )
-                )
-            else:
-                calls.append(call)
-        except AssertionError as err:
-            errors.add(str(err))
-        except ValueError:  # incompatible type
-            pass
+        type_calls, type_errors = _call_by_supporting_reads(
+            source_evidence, event_type, consumed_evidence, flanking_pairs, available, pairs_by_read
+        )
+        calls.extend(type_calls)
+        errors.update(type_errors)
 
     if not calls and errors:
         raise UserWarning(';'.join(sorted(list(errors))))
@@ -780,7 +1027,9 @@ def _call_interval_by_flanking_coverage(
         raise ValueError('orientation must be specific', orientation)
 
 
-def _call_by_flanking_pairs(evidence, event_type, consumed_evidence=None):
+def _call_by_flanking_pairs(
+    evidence, event_type, consumed_evidence=None, available_flanking_pairs=None
+):
     """
     Given a set of flanking reads, computes the coverage interval (the area that is covered by flanking read alignments)
     this area gives the starting position for computing the breakpoint interval.
@@ -796,7 +1045,8 @@ def _call_by_flanking_pairs(evidence, event_type, consumed_evidence=None):
     # the start/end of the read on the breakpoint side
     selected_flanking_pairs = []
     fragments = []
-    available_flanking_pairs = filter_consumed_pairs(evidence.flanking_pairs, consumed_evidence)
+    if available_flanking_pairs is None:
+        available_flanking_pairs = filter_consumed_pairs(evidence.flanking_pairs, consumed_evidence)
 
     def _compute_coverage_intervals(pairs):
         first_positions = []
@@ -824,7 +1074,7 @@ def _call_by_flanking_pairs(evidence, event_type, consumed_evidence=None):
 
     for read, mate in sorted(available_flanking_pairs, key=lambda r: (r[0].key(), r[1].key())):
         # check that the fragment size is reasonable
-        fragment_size = evidence.compute_fragment_size(read, mate)
+        fragment_size = evidence.fragment_size(read, mate)
         if event_type == SVTYPE.DEL:
             if fragment_size.end <= evidence.max_expected_fragment_size:
                 continue
@@ -862,15 +1112,15 @@ def _call_by_flanking_pairs(evidence, event_type, consumed_evidence=None):
             # length of coverage is greater than expected
             # remove the farthest outlier from the pairs wrt fragment size (most likely to belong to a different event)
             average = Interval(
-                sum([f.start for f in fragments]) / len(fragments),
-                sum([f.end for f in fragments]) / len(fragments),
+                sum(f.start for f in fragments) / len(fragments),
+                sum(f.end for f in fragments) / len(fragments),
             )
             farthest = max(fragments, key=lambda f: abs(Interval.dist(f, average)))
             fragments = [f for f in fragments if f != farthest]
             selected_flanking_pairs = [
                 (r, m)
                 for r, m in selected_flanking_pairs
-                if evidence.compute_fragment_size(r, m) != farthest
+                if evidence.fragment_size(r, m) != farthest
             ]
         else:
             break
@@ -901,12 +1151,9 @@ def _call_by_flanking_pairs(evidence, event_type, consumed_evidence=None):
     if not evidence.interchromosomal:
         if window1.start > window2.end:
             raise AssertionError('flanking window regions are incompatible', window1, window2)
-        window1.end = min(
-            [window1.end, window2.end, cover2.start - (0 if event_type == SVTYPE.DUP else 1)]
-        )
-        window2.start = max(
-            [window1.start, window2.start, cover1.end + (0 if event_type == SVTYPE.DUP else 1)]
-        )
+        dup_adj = 0 if event_type == SVTYPE.DUP else 1
+        window1.end = min(window1.end, window2.end, cover2.start - dup_adj)
+        window2.start = max(window1.start, window2.start, cover1.end + dup_adj)
 
     call = EventCall(
         Breakpoint(
@@ -940,7 +1187,9 @@ def _call_by_flanking_pairs(evidence, event_type, consumed_evidence=None):
     return call
 
 
-def _call_by_split_reads(evidence, event_type, consumed_evidence=None):
+def _call_by_split_reads(
+    evidence, event_type, consumed_evidence=None, available_flanking_pairs=None
+):
     """
     use split read evidence to resolve bp-level calls for breakpoint pairs (where possible)
     if a bp level call is not possible for one of the breakpoints then returns None
@@ -948,48 +1197,77 @@ def _call_by_split_reads(evidence, event_type, consumed_evidence=None):
     """
     if consumed_evidence is None:
         consumed_evidence = set()
-    pos1 = {}
-    pos2 = {}
 
-    available_flanking_pairs = filter_consumed_pairs(evidence.flanking_pairs, consumed_evidence)
+    if available_flanking_pairs is None:
+        available_flanking_pairs = filter_consumed_pairs(evidence.flanking_pairs, consumed_evidence)
+
+    # unconsumed split reads are kept up to date as reads are consumed below rather than
+    # re-computing the set difference for every putative call
+    available_split_reads = (
+        evidence.split_reads[0] - consumed_evidence,
+        evidence.split_reads[1] - consumed_evidence,
+    )
+
+    def _resolves_position(reads):
+        if len(reads) < evidence.min_splits_reads_resolution:
+            return False
+        # only need to count as many non-targeted reads as the minimum requires
+        non_target_reads = (
+            read for read in reads if not _read.tag_value(read, PYSAM_READ_FLAGS.TARGETED_ALIGNMENT)
+        )
+        count = sum(
+            1
+            for read in itertools.islice(
+                non_target_reads, evidence.min_non_target_aligned_split_reads
+            )
+        )
+        return count >= evidence.min_non_target_aligned_split_reads
 
-    for i, breakpoint, pos_dict in [(0, evidence.break1, pos1), (1, evidence.break2, pos2)]:
-        for read in evidence.split_reads[i] - consumed_evidence:
+    putative_positions = []
+    for reads, breakpoint in zip(available_split_reads, [evidence.break1, evidence.break2]):
+        pos_dict = {}
+        for read in reads:
             try:
                 pos = _read.breakpoint_pos(read, breakpoint.orient) + 1
-                if pos not in pos_dict:
-                    pos_dict[pos] = set()
-                pos_dict[pos].add(read)
             except AttributeError:
-                pass
-        putative_positions = list(pos_dict.keys())
-        for pos in putative_positions:
-            if len(pos_dict[pos]) < evidence.min_splits_reads_resolution:
-                del pos_dict[pos]
-            else:
-                count = 0
-                for read in pos_dict[pos]:
-                    if not read.has_tag(PYSAM_READ_FLAGS.TARGETED_ALIGNMENT) or not read.get_tag(
-                        PYSAM_READ_FLAGS.TARGETED_ALIGNMENT
-                    ):
-                        count += 1
-                if count < evidence.min_non_target_aligned_split_reads:
-                    del pos_dict[pos]
+                continue
+            pos_dict.setdefault(pos, set()).add(read)
+        putative_positions.append(
+            {pos: reads for pos, reads in pos_dict.items() if _resolves_position(reads)}
+        )
+    pos1, pos2 = putative_positions
 
     linked_pairings = []
+    # reads are shared by many pairings of positions below so the key used to find double aligned
+    # reads (which needs the reverse complement) is computed once per read
+    seq_keys = {}
+    # the same double aligned reads are paired for many pairings of positions so the result of
+    # pairing any two reads is also kept
+    paired_calls = {}
     # now pair up the breakpoints with their putative partners
+    # the names and sequences of the reads only depend on the position so are collected once
+    # rather than for every pairing of positions
+    first_read_names = {}
+    first_reads = {}
+    for first, reads in pos1.items():
+        first_read_names[first] = {r.query_name for r in reads}
+        first_reads[first] = {(r.query_name, r.query_sequence) for r in reads}
+    second_reads = {
+        second: [(r.query_name, r.query_sequence) for r in reads] for second, reads in pos2.items()
+    }
+
     for first, second in itertools.product(sorted(pos1.keys()), sorted(pos2.keys())):
         if evidence.break1.chr == evidence.break2.chr:
             if first >= second:
                 continue
         links = 0
-        read_names = set([r.query_name for r in pos1[first]])
-        reads = set([(r.query_name, r.query_sequence) for r in pos1[first]])
+        read_names = first_read_names[first]
+        reads = first_reads[first]
         tgt_align = 0
-        for read in pos2[second]:
-            if read.query_name in read_names:
+        for read_name, read_seq in second_reads[second]:
+            if read_name in read_names:
                 links += 1
-            if (read.query_name, read.query_sequence) in reads:
+            if (read_name, read_seq) in reads:
                 tgt_align += 1
         if links < evidence.min_linking_split_reads:
             continue
@@ -1006,12 +1284,11 @@ def _call_by_split_reads(evidence, event_type, consumed_evidence=None):
         # check if any of the aligned reads are 'double' aligned
         double_aligned = dict()
         for read in pos1[first] | pos2[second]:
-            seq_key = tuple(
-                sorted(
-                    [read.query_name, read.query_sequence, reverse_complement(read.query_sequence)]
-                )
-            )  # seq and revseq are equal
-            double_aligned.setdefault(seq_key, []).append(read)
+            if read not in seq_keys:
+                # seq and revseq are equal so use whichever sorts first
+                seq = read.query_sequence
+                seq_keys[read] = (read.query_name, min(seq, reverse_complement(seq)))
+            double_aligned.setdefault(seq_keys[read], []).append(read)
 
         # now create calls using the double aligned split read pairs if possible (to resolve untemplated sequence)
         resolved_calls = dict()
@@ -1019,16 +1296,20 @@ def _call_by_split_reads(evidence, event_type, consumed_evidence=None):
             for read1, read2 in itertools.combinations(
                 sorted(list(reads), key=lambda x: x.key()), 2
             ):
-                try:
-                    call = call_paired_read_event(
-                        read1, read2, is_stranded=evidence.bam_cache.stranded
-                    )
+                if (read1, read2) not in paired_calls:
+                    try:
+                        paired_calls[(read1, read2)] = call_paired_read_event(
+                            read1, read2, is_stranded=evidence.bam_cache.stranded
+                        )
+                    except AssertionError:
+                        # will be thrown if the reads do not actually belong together
+                        paired_calls[(read1, read2)] = None
+                call = paired_calls[(read1, read2)]
+                if call is not None:
                     # check the type later, we want this to fail if wrong type
                     resolved_calls.setdefault(call, (set(), set()))
                     resolved_calls[call][0].add(call.read1)
                     resolved_calls[call][1].add(call.read2)
-                except AssertionError:
-                    pass  # will be thrown if the reads do not actually belong together
 
         # if no calls were resolved set the untemplated seq to None
         first_breakpoint = Breakpoint(
@@ -1048,8 +1329,6 @@ def _call_by_split_reads(evidence, event_type, consumed_evidence=None):
         ):
             resolved_calls.setdefault(bpp, (set(), set()))
 
-        uncons_break1_reads = evidence.split_reads[0] - consumed_evidence
-        uncons_break2_reads = evidence.split_reads[1] - consumed_evidence
         for call, (reads1, reads2) in sorted(
             resolved_calls.items(), key=lambda x: (len(x[1][0]) + len(x[1][1]), x[0]), reverse=True
         ):
@@ -1073,9 +1352,9 @@ def _call_by_split_reads(evidence, event_type, consumed_evidence=None):
                 if call.has_compatible:
                     call.add_flanking_support(available_flanking_pairs, is_compatible=True)
                 # add the initial reads
-                for read in uncons_break1_reads - consumed_evidence:
+                for read in available_split_reads[0]:
                     call.add_break1_split_read(read)
-                for read in uncons_break2_reads - consumed_evidence:
+                for read in available_split_reads[1]:
                     call.add_break2_split_read(read)
                 linking_reads = len(call.linking_split_read_names())
                 if (
@@ -1097,7 +1376,9 @@ def _call_by_split_reads(evidence, event_type, consumed_evidence=None):
                 ):
                     linked_pairings.append(call)
                     # consume the evidence
-                    consumed_evidence.update(call.break1_split_reads)
-                    consumed_evidence.update(call.break2_split_reads)
+                    for reads in [call.break1_split_reads, call.break2_split_reads]:
+                        consumed_evidence.update(reads)
+                        available_split_reads[0].difference_update(reads)
+                        available_split_reads[1].difference_update(reads)
 
     return linked_pairings
@@ -15,6 +15,12 @@ RUN_FULL = int(os.environ.get('RUN_FULL', 1))
 OUTPUT_SVG = int(os.environ.get('OUTPUT_SVG', 0))
 _EXAMPLE_GENES = None
 
+# cigar states skipped by the MockRead length calculations. Looked up once here rather than for
+# every cigar tuple of every mock read
+_NOT_REFERENCE_END_STATES = {CIGAR.S, CIGAR.I}
+_NOT_QUERY_ALIGNED_STATES = {CIGAR.S, CIGAR.H}
+_NOT_QUERY_SEQUENCE_STATES = {CIGAR.H, CIGAR.N, CIGAR.D}
+
 
 def get_example_genes():
     global _EXAMPLE_GENES
@@ -86,12 +92,12 @@ class MockRead:
         self.query_sequence = query_sequence
         if self.reference_end is None and cigar and reference_start is not None:
             self.reference_end = reference_start + sum(
-                [f for v, f in cigar if v not in [CIGAR.S, CIGAR.I]]
+                f for v, f in cigar if v not in _NOT_REFERENCE_END_STATES
             )
         if not self.query_alignment_length:
             if cigar:
                 self.query_alignment_length = sum(
-                    [v for s, v in cigar if s not in [CIGAR.S, CIGAR.H]]
+                    v for s, v in cigar if s not in _NOT_QUERY_ALIGNED_STATES
                 )
             elif self.query_sequence:
                 self.query_alignment_length = len(self.query_sequence)
@@ -107,7 +113,8 @@ class MockRead:
         self.query_alignment_start = query_alignment_start
         self.query_alignment_end = query_alignment_end
         self.flag = flag
-        self.tags = tags
+        self.tags = list(tags)
+        self._tag_dict = dict(self.tags)
         if query_alignment_sequence is None and cigar and query_sequence:
             s = 0 if cigar[0][0] != CIGAR.S else cigar[0][1]
             t = len(query_sequence)
@@ -115,13 +122,12 @@ class MockRead:
                 t -= cigar[-1][1]
             self.query_alignment_sequence = query_sequence[s:t]
         if cigar and query_sequence:
-            if len(query_sequence) != sum(
-                [f for v, f in cigar if v not in [CIGAR.H, CIGAR.N, CIGAR.D]]
-            ):
+            cigar_query_length = sum(f for v, f in cigar if v not in _NOT_QUERY_SEQUENCE_STATES)
+            if len(query_sequence) != cigar_query_length:
                 raise AssertionError(
                     'length of sequence does not match cigar',
                     len(query_sequence),
-                    sum([f for v, f in cigar if v not in [CIGAR.H, CIGAR.N, CIGAR.D]]),
+                    cigar_query_length,
                 )
         if template_length is None and reference_end and next_reference_start:
             self.template_length = next_reference_start - reference_end
@@ -158,12 +164,13 @@ class MockRead:
             self.tags.append(new_tag)
         else:
             self.tags.append(new_tag)
+        self._tag_dict[tag] = value
 
     def has_tag(self, tag):
-        return tag in dict(self.tags).keys()
+        return tag in self._tag_dict
 
     def get_tag(self, tag):
-        return dict(self.tags)[tag] if tag in dict(self.tags).keys() else False
+        return self._tag_dict.get(tag, False)
 
     def __str__(self):
         return '{}(ref_id={}, start={}, end={}, seq={})'.format(
@@ -230,10 +237,13 @@ class MockLongString(str):
         return s
 
     def __getitem__(self, index):
-        if isinstance(index, slice):
-            index = slice(index.start - self.offset, index.stop - self.offset, index.step)
+        offset = self.offset
+        if index.__class__ is slice:
+            if index.step is None:
+                return str.__getitem__(self, slice(index.start - offset, index.stop - offset))
+            index = slice(index.start - offset, index.stop - offset, index.step)
         else:
-            index -= self.offset
+            index -= offset
         return str.__getitem__(self, index)
 
     def __len__(self):
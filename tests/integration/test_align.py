@@ -3,7 +3,6 @@ import unittest
 from unittest import mock
 
 from mavis import align
-from mavis.annotate.file_io import load_reference_genome
 from mavis.assemble import Contig
 from mavis.bam.cache import BamCache
 import mavis.bam.cigar as _cigar
@@ -15,14 +14,14 @@ from mavis.validate.constants import DEFAULTS
 from mavis.bam.read import SamRead
 
 from . import MockBamFileHandle, MockObject, MockLongString, MockRead
-from ..util import get_data
+from ..util import get_data, get_mock_reference_genome
 
 REFERENCE_GENOME = None
 
 
 def setUpModule():
     global REFERENCE_GENOME
-    REFERENCE_GENOME = load_reference_genome(get_data('mock_reference_genome.fa'))
+    REFERENCE_GENOME = get_mock_reference_genome()
     if (
         'CTCCAAAGAAATTGTAGTTTTCTTCTGGCTTAGAGGTAGATCATCTTGGT'
         != REFERENCE_GENOME['fake'].seq[0:50].upper()
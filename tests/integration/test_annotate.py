@@ -2,7 +2,7 @@ import os
 import unittest
 
 from mavis.annotate.base import BioInterval, ReferenceName
-from mavis.annotate.file_io import load_reference_genes, load_reference_genome
+from mavis.annotate.file_io import load_reference_genes
 from mavis.annotate.genomic import Exon, Gene, Template, Transcript, PreTranscript
 from mavis.annotate.protein import calculate_orf, Domain, DomainRegion, translate, Translation
 from mavis.annotate.variant import (
@@ -21,7 +21,7 @@ from mavis.error import NotSpecifiedError
 from mavis.interval import Interval
 
 from . import MockLongString, MockObject, get_example_genes
-from ..util import get_data
+from ..util import get_data, get_mock_reference_genome
 
 
 REFERENCE_ANNOTATIONS = None
@@ -37,7 +37,7 @@ def setUpModule():
     count = sum([len(genes) for genes in REFERENCE_ANNOTATIONS.values()])
     print('loaded annotations', count)
     assert count >= 6  # make sure this is the file we expect
-    REFERENCE_GENOME = load_reference_genome(get_data('mock_reference_genome.fa'))
+    REFERENCE_GENOME = get_mock_reference_genome()
     assert REF_CHR in REFERENCE_GENOME
     print('loaded the reference genome', get_data('mock_reference_genome.fa'))
 
@@ -1157,6 +1157,8 @@ class TestUSTranscript(unittest.TestCase):
     def test___init__overlapping_exon_error(self):
         with self.assertRaises(AttributeError):
             PreTranscript(exons=[Exon(1, 15), Exon(10, 20)])
+        with self.assertRaises(AttributeError):
+            PreTranscript(exons=[(30, 40), (1, 100), (5, 10)])
 
     def test_exon_number(self):
         t = PreTranscript(gene=None, exons=[(1, 99), (200, 299), (400, 499)], strand=STRAND.POS)
@@ -1173,6 +1175,14 @@ class TestDomain(unittest.TestCase):
         with self.assertRaises(AttributeError):
             Domain('name', [(1, 3), (4, 3)])
 
+    def test___init__overlapping_regions_error(self):
+        with self.assertRaises(AttributeError):
+            Domain('name', [(20, 30), (1, 5), (8, 12), (12, 15)])
+        with self.assertRaises(AttributeError):
+            Domain('name', [(1, 50), (60, 70), (10, 20)])
+        d = Domain('name', [(20, 30), (1, 5), (8, 12)])
+        self.assertEqual([(1, 5), (8, 12), (20, 30)], [(r.start, r.end) for r in d.regions])
+
     def test_get_seq_from_ref(self):
         ref = {'1': MockObject(seq='CCCTAATCCCCTTT')}
         g = Gene('1', 1, 16, strand=STRAND.NEG)
@@ -1446,6 +1456,13 @@ class TestAnnotate(unittest.TestCase):
         first, second = ReferenceName('chr1'), ReferenceName('1')
         self.assertEqual(first, second)
 
+    def test_reference_name_interned(self):
+        first = ReferenceName('chr1')
+        self.assertIs(first, ReferenceName('chr1'))
+        self.assertIs(first, ReferenceName(first))
+        self.assertIsNot(first, ReferenceName('1'))
+        self.assertEqual('chr1', str(first))
+
     def test_reference_name_set(self):
         first, second = ReferenceName('chr1'), ReferenceName('1')
         d = {first, second}
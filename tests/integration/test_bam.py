@@ -4,7 +4,7 @@ import unittest
 from unittest import mock
 import warnings
 
-from mavis.annotate.file_io import load_reference_genes, load_reference_genome
+from mavis.annotate.file_io import load_reference_genes
 from mavis.bam import cigar as _cigar
 from mavis.bam import read as _read
 from mavis.bam.cache import BamCache
@@ -12,6 +12,7 @@ from mavis.bam.read import (
     breakpoint_pos,
     orientation_supports_type,
     read_pair_type,
+    SamRead,
     sequenced_strand,
 )
 from mavis.bam.stats import compute_genome_bam_stats, compute_transcriptome_bam_stats, Histogram
@@ -19,6 +20,7 @@ from mavis.constants import (
     CIGAR,
     DNA_ALPHABET,
     ORIENT,
+    PYSAM_READ_FLAGS,
     READ_PAIR_TYPE,
     STRAND,
     SVTYPE,
@@ -28,7 +30,7 @@ from mavis.interval import Interval
 import timeout_decorator
 
 from . import MockRead, MockBamFileHandle
-from ..util import get_data
+from ..util import get_data, get_mock_reference_genome
 
 
 REFERENCE_GENOME = None
@@ -37,7 +39,7 @@ REFERENCE_GENOME = None
 def setUpModule():
     warnings.simplefilter('ignore')
     global REFERENCE_GENOME
-    REFERENCE_GENOME = load_reference_genome(get_data('mock_reference_genome.fa'))
+    REFERENCE_GENOME = get_mock_reference_genome()
     if (
         'CTCCAAAGAAATTGTAGTTTTCTTCTGGCTTAGAGGTAGATCATCTTGGT'
         != REFERENCE_GENOME['fake'].seq[0:50].upper()
@@ -123,17 +125,26 @@ class TestBamCache(unittest.TestCase):
     def test_generate_fetch_bins_large_min_size(self):
         self.assertEqual([(1, 50), (51, 100)], BamCache._generate_fetch_bins(1, 100, 5, 50))
 
+
+class TestBamCacheFile(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # open the bam file (and load its index) once for all the tests in this class
+        cls.bam_cache = BamCache(get_data('mini_mock_reads_for_events.sorted.bam'))
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.bam_cache.close()
+
     def test_fetch_single_read(self):
-        b = BamCache(get_data('mini_mock_reads_for_events.sorted.bam'))
-        s = b.fetch_from_bins('reference3', 1382, 1383, read_limit=1, sample_bins=1)
+        s = self.bam_cache.fetch_from_bins('reference3', 1382, 1383, read_limit=1, sample_bins=1)
         self.assertEqual(1, len(s))
         r = list(s)[0]
         self.assertEqual('HISEQX1_11:4:2122:14275:37717:split', r.qname)
-        b.close()
 
     def test_get_mate(self):
         # dependant on fetch working
-        b = BamCache(get_data('mini_mock_reads_for_events.sorted.bam'))
+        b = self.bam_cache
         s = b.fetch_from_bins('reference3', 1382, 1383, read_limit=1, sample_bins=1)
         self.assertEqual(1, len(s))
         r = list(s)[0]
@@ -505,3 +516,15 @@ class TestMapRefRangeToQueryRange(unittest.TestCase):
         self.assertEqual(10, len(qrange))
         self.assertEqual(6, qrange.start)
         self.assertEqual(15, qrange.end)
+
+
+class TestTagValue(unittest.TestCase):
+    def test_missing_tag(self):
+        read = SamRead(reference_name='1')
+        self.assertIsNone(_read.tag_value(read, PYSAM_READ_FLAGS.TARGETED_ALIGNMENT))
+        self.assertFalse(_read.tag_value(read, PYSAM_READ_FLAGS.TARGETED_ALIGNMENT, False))
+
+    def test_tag(self):
+        read = SamRead(reference_name='1')
+        read.set_tag(PYSAM_READ_FLAGS.TARGETED_ALIGNMENT, 1)
+        self.assertEqual(1, _read.tag_value(read, PYSAM_READ_FLAGS.TARGETED_ALIGNMENT))
@@ -1,7 +1,6 @@
 import unittest
 import warnings
 
-from mavis.annotate.file_io import load_reference_genome
 from mavis.bam.cigar import (
     alignment_matches,
     compute,
@@ -22,8 +21,8 @@ from mavis.bam import read as _read
 import timeout_decorator
 
 from . import MockRead, MockObject
-from ..util import get_data
 
+from ..util import get_mock_reference_genome
 
 REFERENCE_GENOME = None
 
@@ -31,7 +30,7 @@ REFERENCE_GENOME = None
 def setUpModule():
     warnings.simplefilter('ignore')
     global REFERENCE_GENOME
-    REFERENCE_GENOME = load_reference_genome(get_data('mock_reference_genome.fa'))
+    REFERENCE_GENOME = get_mock_reference_genome()
     if (
         'CTCCAAAGAAATTGTAGTTTTCTTCTGGCTTAGAGGTAGATCATCTTGGT'
         != REFERENCE_GENOME['fake'].seq[0:50].upper()
@@ -91,6 +90,21 @@ class TestRecomputeCigarMismatch(unittest.TestCase):
             recompute_cigar_mismatch(r, REFERENCE_GENOME['fake']),
         )
 
+    def test_reference_str(self):
+        r = MockRead(
+            reference_start=1452,
+            query_sequence='CAGC' 'CCCAAACAAC' 'TATAAATTTT' 'GTAATACCTA' 'GAACAATATA' 'AATAT',
+            cigar=[(CIGAR.M, 14), (CIGAR.D, 10), (CIGAR.I, 10), (CIGAR.M, 25)],
+        )
+        self.assertEqual(
+            recompute_cigar_mismatch(r, REFERENCE_GENOME['fake']),
+            recompute_cigar_mismatch(r, str(REFERENCE_GENOME['fake'].seq)),
+        )
+
+    def test_ambiguous_base(self):
+        r = MockRead(reference_start=0, query_sequence='ACNTACGA', cigar=[(CIGAR.M, 8)])
+        self.assertEqual([(CIGAR.EQ, 7), (CIGAR.X, 1)], recompute_cigar_mismatch(r, 'ACGTACGT'))
+
 
 class TestExtendSoftclipping(unittest.TestCase):
     def test_softclipped_right(self):
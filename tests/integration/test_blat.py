@@ -3,7 +3,6 @@ import unittest
 
 from Bio import SeqIO
 from mavis.align import query_coverage_interval
-from mavis.annotate.file_io import load_reference_genome
 from mavis.bam.cache import BamCache
 from mavis.blat import Blat
 from mavis.constants import CIGAR, reverse_complement
@@ -11,7 +10,7 @@ from mavis.interval import Interval
 import mavis.bam.cigar as _cigar
 
 from . import MockBamFileHandle, MockObject, MockLongString
-from ..util import get_data
+from ..util import get_data, get_mock_reference_genome
 
 
 REFERENCE_GENOME = None
@@ -19,7 +18,7 @@ REFERENCE_GENOME = None
 
 def setUpModule():
     global REFERENCE_GENOME
-    REFERENCE_GENOME = load_reference_genome(get_data('mock_reference_genome.fa'))
+    REFERENCE_GENOME = get_mock_reference_genome()
     if (
         'CTCCAAAGAAATTGTAGTTTTCTTCTGGCTTAGAGGTAGATCATCTTGGT'
         != REFERENCE_GENOME['fake'].seq[0:50].upper()
@@ -1,6 +1,5 @@
 import unittest
 
-from mavis.annotate.file_io import load_reference_genome
 from mavis.breakpoint import Breakpoint, BreakpointPair
 from mavis.constants import CIGAR, ORIENT, reverse_complement, STRAND
 from mavis.interval import Interval
@@ -9,7 +8,7 @@ from mavis.validate.constants import DEFAULTS
 from functools import partial
 
 from . import MockRead, MockObject, get_example_genes
-from ..util import get_data
+from ..util import get_mock_reference_genome
 
 REFERENCE_GENOME = None
 REF_CHR = 'fake'
@@ -17,7 +16,7 @@ REF_CHR = 'fake'
 
 def setUpModule():
     global REFERENCE_GENOME
-    REFERENCE_GENOME = load_reference_genome(get_data('mock_reference_genome.fa'))
+    REFERENCE_GENOME = get_mock_reference_genome()
     if (
         'CTCCAAAGAAATTGTAGTTTTCTTCTGGCTTAGAGGTAGATCATCTTGGT'
         != REFERENCE_GENOME[REF_CHR].seq[0:50].upper()
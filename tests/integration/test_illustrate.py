@@ -3,7 +3,7 @@ import unittest
 import os
 
 from mavis.annotate.base import BioInterval
-from mavis.annotate.file_io import load_templates
+from mavis.annotate.file_io import ReferenceFile
 from mavis.annotate import genomic
 from mavis.annotate import protein
 from mavis.annotate import variant
@@ -33,12 +33,20 @@ DEFAULTS.domain_name_regex_filter = r'.*'
 
 def setUpModule():
     global TEMPLATE_METADATA, EXAMPLE_ANNOTATIONS
-    TEMPLATE_METADATA = load_templates(get_data('cytoBand.txt'))
+    # load through the reference file cache so other test modules loading the same file share it
+    TEMPLATE_METADATA = ReferenceFile('template_metadata', get_data('cytoBand.txt')).load().content
 
 
 class TestDraw(unittest.TestCase):
     def setUp(self):
-        self.canvas = Drawing(height=100, width=1000)
+        self._canvas = None
+
+    @property
+    def canvas(self):
+        # most tests create their own canvas so only build the shared one when it is used
+        if self._canvas is None:
+            self._canvas = Drawing(height=100, width=1000)
+        return self._canvas
 
     def test_generate_interval_mapping_outside_range_error(self):
         temp = [
@@ -300,9 +308,13 @@ class TestDraw(unittest.TestCase):
         ann = variant.Annotation(
             bpp, transcript1=t1, transcript2=t2, event_type=SVTYPE.DEL, protocol=PROTOCOL.GENOME
         )
-        ann.add_gene(genomic.Gene('1', 1500, 1950, strand=STRAND.POS))
-        ann.add_gene(genomic.Gene('1', 3000, 3980, strand=STRAND.POS))
-        ann.add_gene(genomic.Gene('1', 3700, 4400, strand=STRAND.NEG))
+        ann.add_genes(
+            [
+                genomic.Gene('1', 1500, 1950, strand=STRAND.POS),
+                genomic.Gene('1', 3000, 3980, strand=STRAND.POS),
+                genomic.Gene('1', 3700, 4400, strand=STRAND.NEG),
+            ]
+        )
 
         reference_genome = {'1': MockObject(seq=MockString('A'))}
 
@@ -364,14 +376,18 @@ class TestDraw(unittest.TestCase):
         ann = variant.Annotation(
             bpp, transcript1=t1, transcript2=t2, event_type=SVTYPE.ITRANS, protocol=PROTOCOL.GENOME
         )
-        # genes 1
-        ann.add_gene(genomic.Gene('1', 1500, 1950, strand=STRAND.POS))
-        ann.add_gene(genomic.Gene('1', 3000, 3980, strand=STRAND.POS))
-        ann.add_gene(genomic.Gene('1', 3700, 4400, strand=STRAND.NEG))
-        # genes 2
-        ann.add_gene(genomic.Gene('2', 1500, 1950, strand=STRAND.NEG))
-        ann.add_gene(genomic.Gene('2', 5500, 9000, strand=STRAND.POS))
-        ann.add_gene(genomic.Gene('2', 3700, 4400, strand=STRAND.NEG))
+        ann.add_genes(
+            [
+                # genes 1
+                genomic.Gene('1', 1500, 1950, strand=STRAND.POS),
+                genomic.Gene('1', 3000, 3980, strand=STRAND.POS),
+                genomic.Gene('1', 3700, 4400, strand=STRAND.NEG),
+                # genes 2
+                genomic.Gene('2', 1500, 1950, strand=STRAND.NEG),
+                genomic.Gene('2', 5500, 9000, strand=STRAND.POS),
+                genomic.Gene('2', 3700, 4400, strand=STRAND.NEG),
+            ]
+        )
 
         reference_genome = {
             '1': MockObject(seq=MockString('A')),
@@ -1,6 +1,5 @@
 import unittest
 
-from mavis.annotate.file_io import load_reference_genome
 from mavis.bam.cache import BamCache
 from mavis.breakpoint import Breakpoint
 from mavis.constants import ORIENT, PYSAM_READ_FLAGS, NA_MAPPING_QUALITY
@@ -10,14 +9,14 @@ from mavis.bam.read import SamRead
 from mavis.bam import cigar as _cigar
 
 from . import mock_read_pair, MockRead, RUN_FULL, MockObject, MockLongString
-from ..util import get_data
+from ..util import get_data, get_mock_reference_genome
 
 REFERENCE_GENOME = None
 
 
 def setUpModule():
     global REFERENCE_GENOME
-    REFERENCE_GENOME = load_reference_genome(get_data('mock_reference_genome.fa'))
+    REFERENCE_GENOME = get_mock_reference_genome()
     if (
         'CTCCAAAGAAATTGTAGTTTTCTTCTGGCTTAGAGGTAGATCATCTTGGT'
         != REFERENCE_GENOME['fake'].seq[0:50].upper()
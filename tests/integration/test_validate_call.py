@@ -1,29 +1,30 @@
 import unittest
 from unittest import mock
 
+import numpy as np
+
 from mavis.align import call_paired_read_event, select_contig_alignments
-from mavis.annotate.file_io import load_reference_genome
 from mavis.annotate.genomic import PreTranscript, Transcript
 from mavis.bam.cache import BamCache
 from mavis.bam.read import sequenced_strand, SamRead, read_pair_type
 from mavis.bam.cigar import convert_string_to_cigar
 from mavis.bam import cigar as _cigar
 from mavis.breakpoint import Breakpoint, BreakpointPair
-from mavis.constants import CALL_METHOD, CIGAR, ORIENT, PYSAM_READ_FLAGS, STRAND, SVTYPE
+from mavis.constants import CALL_METHOD, CIGAR, COLUMNS, ORIENT, PYSAM_READ_FLAGS, STRAND, SVTYPE
 from mavis.interval import Interval
 from mavis.validate import call
 from mavis.validate.base import Evidence
 from mavis.validate.evidence import GenomeEvidence, TranscriptomeEvidence
 
 from . import mock_read_pair, MockBamFileHandle, MockRead, get_example_genes, MockLongString
-from ..util import get_data
+from ..util import get_data, get_mock_reference_genome
 
 REFERENCE_GENOME = None
 
 
 def setUpModule():
     global REFERENCE_GENOME
-    REFERENCE_GENOME = load_reference_genome(get_data('mock_reference_genome.fa'))
+    REFERENCE_GENOME = get_mock_reference_genome()
     if (
         'CTCCAAAGAAATTGTAGTTTTCTTCTGGCTTAGAGGTAGATCATCTTGGT'
         != REFERENCE_GENOME['fake'].seq[0:50].upper()
@@ -100,6 +101,32 @@ class TestCallByContig(unittest.TestCase):
         self.assertTrue(events[0].contig_alignment.score() > 0.99)
 
 
+class TestIndexSplitReadsByBreakpoint(unittest.TestCase):
+    def test_sorted_by_breakpoint(self):
+        late = MockRead(
+            reference_start=200, reference_end=250, cigar=[(CIGAR.M, 50), (CIGAR.S, 50)]
+        )
+        early = MockRead(
+            reference_start=100, reference_end=150, cigar=[(CIGAR.M, 50), (CIGAR.S, 50)]
+        )
+        positions, reads = call.index_split_reads_by_breakpoint([late, early], ORIENT.LEFT)
+        self.assertEqual([150, 250], positions)
+        self.assertEqual([early, late], reads)
+
+    def test_drops_unsupported_orientation(self):
+        left_clipped = MockRead(
+            reference_start=100, reference_end=150, cigar=[(CIGAR.S, 50), (CIGAR.M, 50)]
+        )
+        right_clipped = MockRead(
+            reference_start=100, reference_end=150, cigar=[(CIGAR.M, 50), (CIGAR.S, 50)]
+        )
+        positions, reads = call.index_split_reads_by_breakpoint(
+            [left_clipped, right_clipped], ORIENT.RIGHT
+        )
+        self.assertEqual([101], positions)
+        self.assertEqual([left_clipped], reads)
+
+
 class TestEventCall(unittest.TestCase):
     def setUp(self):
         self.ev1 = GenomeEvidence(
@@ -178,6 +205,38 @@ class TestEventCall(unittest.TestCase):
         self.assertEqual(530, median)
         self.assertEqual(30, stdev)
 
+    def test_flatten_split_read_names(self):
+        self.ev.break1_split_reads.update(
+            {
+                MockRead('c', 3, 1100, 1200, query_sequence='ACGT'),
+                MockRead('a', 3, 1100, 1200, query_sequence='ACGT'),
+                MockRead(
+                    'b',
+                    3,
+                    1100,
+                    1200,
+                    query_sequence='ACGT',
+                    tags=[(PYSAM_READ_FLAGS.TARGETED_ALIGNMENT, 1)],
+                ),
+            }
+        )
+        self.ev.break2_split_reads.update(
+            {
+                MockRead('c', 3, 2100, 2200, query_sequence='ACGT'),
+                MockRead('b', 3, 2100, 2200, query_sequence='ACGT'),
+                MockRead('d', 3, 2100, 2200, query_sequence='ACGT'),
+            }
+        )
+        row = self.ev.flatten()
+        self.assertEqual(2, row[COLUMNS.break1_split_reads])
+        self.assertEqual(1, row[COLUMNS.break1_split_reads_forced])
+        self.assertEqual('a;b;c', row[COLUMNS.break1_split_read_names])
+        self.assertEqual(3, row[COLUMNS.break2_split_reads])
+        self.assertEqual(0, row[COLUMNS.break2_split_reads_forced])
+        self.assertEqual('b;c;d', row[COLUMNS.break2_split_read_names])
+        self.assertEqual(2, row[COLUMNS.linking_split_reads])
+        self.assertEqual('b;c', row[COLUMNS.linking_split_read_names])
+
     def test_split_read_support_empty(self):
         self.assertEqual(0, len(self.ev.break1_split_reads) + len(self.ev.break2_split_reads))
 
@@ -429,6 +488,35 @@ class TestPullFlankingSupport(unittest.TestCase):
         event.add_flanking_support(flanking_pairs)
         self.assertEqual(1, len(event.flanking_pairs))
 
+    def test_deletion_mixed_support_from_iterator(self):
+        evidence = self.build_genome_evidence(
+            Breakpoint('1', 500, orient=ORIENT.LEFT), Breakpoint('1', 1000, orient=ORIENT.RIGHT)
+        )
+        supporting = mock_read_pair(
+            MockRead('r1', 0, 400, 450, is_reverse=False),
+            MockRead('r1', 0, 1200, 1260, is_reverse=True),
+        )
+        flanking_pairs = [
+            supporting,
+            mock_read_pair(  # wrong position for the call
+                MockRead('r2', 0, 501, 600, is_reverse=False),
+                MockRead('r2', 0, 1200, 1260, is_reverse=True),
+            ),
+            mock_read_pair(  # wrong orientation for a deletion
+                MockRead('r3', 0, 400, 450, is_reverse=True),
+                MockRead('r3', 0, 1200, 1260, is_reverse=False),
+            ),
+        ]
+        event = call.EventCall(
+            Breakpoint('1', 500, orient=ORIENT.LEFT),
+            Breakpoint('1', 1000, orient=ORIENT.RIGHT),
+            evidence,
+            SVTYPE.DEL,
+            CALL_METHOD.SPLIT,
+        )
+        event.add_flanking_support(iter(flanking_pairs))
+        self.assertEqual({supporting}, event.flanking_pairs)
+
     def test_outside_call_range(self):
         raise unittest.SkipTest('TODO')
 
@@ -663,6 +751,85 @@ class TestEvidenceConsumption(unittest.TestCase):
         self.assertEqual(501, events[0].break2.start)
         self.assertEqual('contig', events[0].call_method)
 
+    def test_contig_calls_share_support(self):
+        evidence = self.build_genome_evidence(
+            Breakpoint('1', 50, 150, orient=ORIENT.LEFT),
+            Breakpoint('1', 450, 500, orient=ORIENT.RIGHT),
+            opposing_strands=False,
+        )
+        for seq in ['A' * 100, 'C' * 100]:
+            r1, r2 = mock_read_pair(
+                MockRead(
+                    query_name='t1',
+                    reference_id=0,
+                    reference_name='1',
+                    reference_start=40,
+                    cigar=[(CIGAR.EQ, 60), (CIGAR.S, 40)],
+                    query_sequence=seq,
+                    query_alignment_length=100,
+                ),
+                MockRead(
+                    query_name='t1',
+                    reference_id=0,
+                    reference_name='1',
+                    reference_start=480,
+                    cigar=[(CIGAR.S, 40), (CIGAR.EQ, 60)],
+                    query_sequence=seq,
+                    query_alignment_length=100,
+                ),
+            )
+            evidence.contigs.append(
+                mock.Mock(
+                    **{
+                        'seq': seq,
+                        'complexity.return_value': 1,
+                        'alignments': [call_paired_read_event(r1, r2)],
+                    }
+                )
+            )
+        split_read = MockRead(
+            query_name='t1',
+            reference_name='1',
+            reference_start=80,
+            cigar=[(CIGAR.EQ, 20), (CIGAR.S, 80)],
+        )
+        evidence.split_reads[0].add(split_read)
+        flanking_pair = mock_read_pair(
+            MockRead(
+                query_name='t3',
+                reference_name='1',
+                reference_id=0,
+                reference_start=49,
+                reference_end=90,
+                is_reverse=False,
+                query_alignment_length=100,
+            ),
+            MockRead(
+                query_name='t3',
+                reference_name='1',
+                reference_id=0,
+                reference_start=505,
+                reference_end=550,
+                is_reverse=True,
+                query_alignment_length=100,
+            ),
+        )
+        evidence.flanking_pairs.add(flanking_pair)
+
+        with mock.patch.object(
+            call.EventCall,
+            'add_flanking_support',
+            autospec=True,
+            side_effect=call.EventCall.add_flanking_support,
+        ) as add_flanking_support:
+            events = call._call_by_contigs(evidence)
+        self.assertEqual(2, len(events))
+        self.assertEqual(1, add_flanking_support.call_count)
+        self.assertNotEqual(events[0].contig, events[1].contig)
+        for event in events:
+            self.assertEqual({flanking_pair}, event.flanking_pairs)
+            self.assertEqual({split_read}, event.break1_split_reads)
+
     def test_call_contig_and_split(self):
         # contig breakpoint is 100L 501R, split reads is 120L 521R
         evidence = self.build_genome_evidence(
@@ -878,6 +1045,63 @@ class TestCallBySupportingReads(unittest.TestCase):
         with self.assertRaises(AssertionError):
             bpp = call._call_by_flanking_pairs(self.ev, SVTYPE.INV)[0]
 
+    def test_by_supporting_reads_does_not_modify_inputs(self):
+        for name, seq1, seq2 in [('t1', 'A' * 40, 'G' * 40), ('t2', 'C' * 40, 'A' * 40)]:
+            self.ev.split_reads[0].add(
+                MockRead(
+                    query_name=name,
+                    reference_start=100,
+                    cigar=[(CIGAR.S, 20), (CIGAR.EQ, 20)],
+                    query_sequence=seq1,
+                )
+            )
+            self.ev.split_reads[1].add(
+                MockRead(
+                    query_name=name,
+                    reference_start=500,
+                    cigar=[(CIGAR.S, 20), (CIGAR.EQ, 20)],
+                    query_sequence=seq2,
+                )
+            )
+        # supports the split read call
+        split_call_pair = mock_read_pair(
+            MockRead(
+                query_name='f1',
+                reference_id=0,
+                reference_start=110,
+                reference_end=150,
+                is_reverse=True,
+            ),
+            MockRead(reference_id=0, reference_start=510, reference_end=550, is_reverse=True),
+        )
+        # only compatible with the (less specific) flanking call
+        flanking_call_pair = mock_read_pair(
+            MockRead(
+                query_name='f2',
+                reference_id=0,
+                reference_start=60,
+                reference_end=100,
+                is_reverse=True,
+            ),
+            MockRead(reference_id=0, reference_start=460, reference_end=500, is_reverse=True),
+        )
+        pairs = [split_call_pair, flanking_call_pair]
+        previously_consumed = MockRead(query_name='other', reference_start=10, reference_end=50)
+        consumed = {previously_consumed}
+        available = np.ones(len(pairs), dtype=bool)
+
+        calls, errors = call._call_by_supporting_reads(
+            self.ev, SVTYPE.INV, consumed, pairs, available, call.index_pairs_by_read(pairs)
+        )
+        self.assertEqual(set(), errors)
+        self.assertEqual([CALL_METHOD.SPLIT, CALL_METHOD.FLANK], [c.call_method for c in calls])
+        self.assertEqual({split_call_pair}, calls[0].flanking_pairs)
+        # the pair used by the split read call is consumed before the flanking call is made
+        self.assertEqual({flanking_call_pair}, calls[1].flanking_pairs)
+        # but the inputs are not modified
+        self.assertEqual({previously_consumed}, consumed)
+        self.assertEqual([True, True], available.tolist())
+
     def test_call_no_duplication_by_split_reads(self):
         self.dup.split_reads[0].add(
             MockRead(query_name='t1', reference_start=30, cigar=[(CIGAR.EQ, 20), (CIGAR.S, 20)])
@@ -1783,6 +2007,51 @@ class TestCharacterizeRepeatRegion(unittest.TestCase):
             (0, 'TTG'), call.EventCall.characterize_repeat_region(bpp, reference_genome)
         )
 
+    def test_long_homopolymer_insertion_to_reference_start(self):
+        bpp = BreakpointPair(
+            Breakpoint('1', 40, orient=ORIENT.LEFT),
+            Breakpoint('1', 41, orient=ORIENT.RIGHT),
+            untemplated_seq='A',
+            opposing_strands=False,
+            event_type=SVTYPE.INS,
+        )
+        reference_genome = {'1': mock.Mock(seq=MockLongString('A' * 40 + 'GTCAG', offset=0))}
+        # the first base of the reference is never compared
+        self.assertEqual(
+            (39, 'A'), call.EventCall.characterize_repeat_region(bpp, reference_genome)
+        )
+
+    def test_long_repeat_insertion(self):
+        bpp = BreakpointPair(
+            Breakpoint('1', 130, orient=ORIENT.LEFT),
+            Breakpoint('1', 131, orient=ORIENT.RIGHT),
+            untemplated_seq='AT',
+            opposing_strands=False,
+            event_type=SVTYPE.INS,
+        )
+        reference_genome = {
+            '1': mock.Mock(seq=MockLongString('CGATTC' + 'AT' * 12 + 'GGACAAG', offset=100))
+        }
+        self.assertEqual(
+            (12, 'AT'), call.EventCall.characterize_repeat_region(bpp, reference_genome)
+        )
+
+    def test_lower_case_insertion_does_not_match_reference(self):
+        # the untemplated sequence is compared as given against the (uppercased) reference
+        bpp = BreakpointPair(
+            Breakpoint('1', 130, orient=ORIENT.LEFT),
+            Breakpoint('1', 131, orient=ORIENT.RIGHT),
+            untemplated_seq='at',
+            opposing_strands=False,
+            event_type=SVTYPE.INS,
+        )
+        reference_genome = {
+            '1': mock.Mock(seq=MockLongString('CGATTC' + 'AT' * 12 + 'GGACAAG', offset=100))
+        }
+        self.assertEqual(
+            (0, 'at'), call.EventCall.characterize_repeat_region(bpp, reference_genome)
+        )
+
     def test_invalid_event_type(self):
         bpp = BreakpointPair(
             Breakpoint('1', 125, orient=ORIENT.RIGHT),
@@ -1,5 +1,6 @@
 from functools import partial
 import unittest
+from unittest import mock
 
 from mavis.annotate.genomic import Gene, Transcript, PreTranscript
 from mavis.bam.cache import BamCache
@@ -208,6 +209,56 @@ class TestComputeFragmentSizes(unittest.TestCase):
         self.assertEqual(Interval(1300), self.trans_ev.compute_fragment_size(read, mate))
         self.assertEqual(Interval(1300), self.trans_ev.compute_fragment_size(mate, read))
 
+    def test_fragment_size_is_memoized(self):
+        read, mate = mock_read_pair(
+            MockRead('name', '1', 1001, 1100, is_reverse=False),
+            MockRead('name', '1', 2201, 2301, is_reverse=True),
+        )
+        for evidence in [self.genomic_ev, self.trans_ev]:
+            fragment_size = evidence.fragment_size(read, mate)
+            self.assertEqual(Interval(1300), fragment_size)
+            with mock.patch.object(evidence, 'compute_fragment_size') as compute:
+                self.assertIs(fragment_size, evidence.fragment_size(read, mate))
+                compute.assert_not_called()
+
+    def test_pair_positions(self):
+        read, mate = mock_read_pair(
+            MockRead('name', '1', 1001, 1100, is_reverse=False),
+            MockRead('name', '1', 2201, 2301, is_reverse=True),
+        )
+        positions = self.genomic_ev.pair_positions(read, mate)
+        self.assertEqual((1300, 1300, 1001, 1100, 2201, 2301, False), positions)
+        with mock.patch.object(self.genomic_ev, 'fragment_size') as fragment_size:
+            self.assertIs(positions, self.genomic_ev.pair_positions(read, mate))
+            fragment_size.assert_not_called()
+
+
+class TestReadEvents(unittest.TestCase):
+    def test_events_are_memoized(self):
+        evidence = GenomeEvidence(
+            Breakpoint('1', 1051, 1051, 'L'),
+            Breakpoint('1', 1551, 1551, 'R'),
+            BamCache(MockBamFileHandle({'1': 0})),
+            None,
+            opposing_strands=False,
+            read_length=50,
+            stdev_fragment_size=100,
+            median_fragment_size=100,
+        )
+        read = MockRead(
+            'name',
+            0,
+            1000,
+            reference_name='1',
+            cigar=_cigar.convert_string_to_cigar('50=500D50='),
+            query_sequence='A' * 100,
+        )
+        events = evidence.read_events(read)
+        self.assertEqual(1, len(events))
+        self.assertEqual(Breakpoint('1', 1050, orient='L'), events[0].break1)
+        self.assertEqual(Breakpoint('1', 1551, orient='R'), events[0].break2)
+        self.assertIs(events, evidence.read_events(read))
+
 
 class TestTraverse(unittest.TestCase):
     def setUp(self):
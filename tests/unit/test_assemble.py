@@ -4,7 +4,15 @@ import os
 import unittest
 import pytest
 
-from mavis.assemble import assemble, Contig, DeBruijnGraph, filter_contigs, kmers
+from mavis.assemble import (
+    assemble,
+    Contig,
+    DeBruijnGraph,
+    digraph_connected_components,
+    digraph_cyclic_nodes,
+    filter_contigs,
+    kmers,
+)
 from mavis.constants import DNA_ALPHABET
 
 DATA_DIR = os.path.join(os.path.dirname(__file__), 'data')
@@ -25,6 +33,8 @@ class TestModule(unittest.TestCase):
         self.assertEqual(['AB', 'BC', 'CD', 'DE', 'EF', 'FG'], k)
         k = kmers('ABCDEFG', 3)
         self.assertEqual(['ABC', 'BCD', 'CDE', 'DEF', 'EFG'], k)
+        self.assertEqual(['ABCDEFG'], kmers('ABCDEFG', 7))
+        self.assertEqual([], kmers('ABCDEFG', 8))
 
     def test_assemble(self):
         sequences = ['ABCD', 'BCDE', 'CDEF', 'ABCDE', 'DEFG']
@@ -137,6 +147,16 @@ class TestDeBruijnGraph(unittest.TestCase):
         self.assertEqual(2, g.get_edge_freq(1, 2))
         g.add_edge(1, 2, 5)
         self.assertEqual(7, g.get_edge_freq(1, 2))
+        self.assertEqual(7, g.get_edge_data(1, 2)['freq'])
+        self.assertEqual([(1, 2, {'freq': 7})], g.in_edges(2, data=True))
+
+    def test_get_edge_freq_missing_edge(self):
+        g = DeBruijnGraph()
+        g.add_edge(1, 2)
+        with self.assertRaises(KeyError):
+            g.get_edge_freq(2, 1)
+        with self.assertRaises(KeyError):
+            g.get_edge_freq(3, 1)
 
     def test_trim_noncutting_paths_by_freq_degree_stop(self):
         g = DeBruijnGraph()
@@ -177,6 +197,37 @@ class TestDeBruijnGraph(unittest.TestCase):
         self.assertEqual(list(range(1, 9)) + path2[1:-1], g.nodes())
 
 
+class TestDigraphConnectedComponents(unittest.TestCase):
+    def test_components(self):
+        g = DeBruijnGraph()
+        for s, t in [(1, 2), (3, 2), (4, 5), (5, 4), (6, 6)]:
+            g.add_edge(s, t)
+        g.add_node(7)
+        components = digraph_connected_components(g)
+        self.assertEqual([{1, 2, 3}, {4, 5}, {6}, {7}], sorted(components, key=min))
+
+    def test_subgraph(self):
+        g = DeBruijnGraph()
+        for s, t in [(1, 2), (2, 3), (3, 4)]:
+            g.add_edge(s, t)
+        components = digraph_connected_components(g, {1, 2, 4, 8})
+        self.assertEqual([{1, 2}, {4}], sorted(components, key=min))
+
+
+class TestDigraphCyclicNodes(unittest.TestCase):
+    def test_acyclic(self):
+        g = DeBruijnGraph()
+        for s, t in [(1, 2), (1, 3), (2, 4), (3, 4)]:
+            g.add_edge(s, t)
+        self.assertEqual(set(), digraph_cyclic_nodes(g))
+
+    def test_cycles(self):
+        g = DeBruijnGraph()
+        for s, t in [(1, 2), (2, 3), (3, 1), (0, 1), (3, 4), (5, 5), (6, 7)]:
+            g.add_edge(s, t)
+        self.assertEqual({1, 2, 3, 4, 5}, digraph_cyclic_nodes(g))
+
+
 class TestFullAssemly(unittest.TestCase):
     def setUp(self):
         # load the sequences
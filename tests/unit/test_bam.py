@@ -1,3 +1,4 @@
+import re
 import unittest
 
 from mavis.bam import cigar as _cigar
@@ -353,3 +354,17 @@ class TestSequenceComplexity(unittest.TestCase):
 
     def test_empty(self):
         self.assertEqual(0, _read.sequence_complexity(''))
+
+
+class TestFindNonOverlapping(unittest.TestCase):
+    def test_matches_finditer(self):
+        for substring, string in [
+            ('AA', 'AAAAA'),
+            ('ATA', 'ATATATA'),
+            ('GC', 'ATATAT'),
+            ('AT', 'AT'),
+        ]:
+            self.assertEqual(
+                [m.start() for m in re.finditer(substring, string)],
+                _read._find_non_overlapping(substring, string),
+            )
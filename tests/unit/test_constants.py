@@ -1,4 +1,7 @@
+import os
 import unittest
+from unittest import mock
+
 from mavis.constants import (
     COLUMNS,
     MavisNamespace,
@@ -97,6 +100,16 @@ class TestMavisNamespace(unittest.TestCase):
         with self.assertRaises(KeyError):
             self.namespace.enforce(5)
 
+    def test_enforce(self):
+        self.assertEqual(2, self.namespace.enforce(2))
+
+    def test_enforce_env_overwritable(self):
+        self.namespace.add('d', 4, env_overwritable=True)
+        with mock.patch.dict(os.environ, {'MAVIS_D': '5'}):
+            self.assertEqual(5, self.namespace.enforce(5))
+            with self.assertRaises(KeyError):
+                self.namespace.enforce(4)
+
     def test_reverse(self):
         self.assertEqual('a', self.namespace.reverse(1))
 
@@ -1,5 +1,6 @@
 import unittest
-from mavis.illustrate.util import generate_interval_mapping
+from mavis.illustrate.constants import DiagramSettings
+from mavis.illustrate.util import generate_interval_mapping, LabelMapping
 from mavis.interval import Interval
 
 
@@ -34,3 +35,33 @@ class TestGenerateIntervalMapping(unittest.TestCase):
             [], target, ratio, min_width, buffer_, start, end, min_inter
         )
         self.assertEqual(1, len(mapping.keys()))
+
+
+class TestDiagramSettings(unittest.TestCase):
+    def test_domain_fill_gradient(self):
+        d1 = DiagramSettings()
+        d2 = DiagramSettings(domain_color='#ffffff', domain_mismatch_color='#000000')
+        self.assertEqual(10, len(d1.domain_fill_gradient))
+        self.assertEqual('#000', d2.domain_fill_gradient[0])
+        self.assertEqual('#fff', d2.domain_fill_gradient[-1])
+        d1.domain_fill_gradient.append('#fff')
+        self.assertEqual(10, len(DiagramSettings().domain_fill_gradient))
+
+
+class TestLabelMapping(unittest.TestCase):
+    def test_add(self):
+        labels = LabelMapping()
+        self.assertEqual('G1', labels.add('a', 'G'))
+        self.assertEqual('G2', labels.add('b', 'G'))
+        self.assertEqual('B1', labels.add('c', 'B'))
+        self.assertEqual('G1', labels.add('a', 'G'))
+        labels['G3'] = 'd'
+        self.assertEqual('G4', labels.add('e', 'G'))
+
+    def test_add_after_set_key(self):
+        labels = LabelMapping()
+        labels.add('a', 'G')
+        labels.add('b', 'G')
+        labels.set_key('G1', 'c')
+        self.assertEqual('G1', labels.add('c', 'G'))
+        self.assertEqual('G3', labels.add('a', 'G'))
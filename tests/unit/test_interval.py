@@ -136,6 +136,15 @@ class TestInterval(unittest.TestCase):
         with self.assertRaises(IndexError):
             Interval.convert_pos(mapping, 80)
 
+    def test_convert_pos_after_add(self):
+        mapping = IntervalMapping({(1, 10): (101, 110), (41, 50): (301, 310)})
+        self.assertEqual(105, mapping.convert_pos(5))
+        with self.assertRaises(IndexError):
+            mapping.convert_pos(25)
+        mapping.add((21, 30), (201, 210), opposing_directions=False)
+        self.assertEqual(205, mapping.convert_pos(25))
+        self.assertEqual(305, mapping.convert_pos(45))
+
     def test_convert_pos_forward_to_reverse(self):
         mapping = {(41, 50): (101, 110), (21, 30): (201, 210), (1, 10): (301, 310)}
 
@@ -116,6 +116,14 @@ class TestWeakMavisNamespace(unittest.TestCase):
         self.assertEqual(1, self.namespace._members['a'])
         self.assertEqual(5, self.namespace['a'])
 
+    def test_enforce_env_override(self):
+        os.environ['MAVIS_A'] = '7'
+        self.addCleanup(os.environ.pop, 'MAVIS_A', None)
+        self.assertEqual([7, 2, 3], self.namespace.values())
+        self.assertEqual(7, self.namespace.enforce(7))
+        with self.assertRaises(KeyError):
+            self.namespace.enforce(1)
+
     def test_error_on_invalid_attr(self):
         with self.assertRaises(AttributeError):
             self.namespace.other
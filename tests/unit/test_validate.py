@@ -1,7 +1,15 @@
 import unittest
 
+import numpy as np
+
 from mavis.constants import ORIENT
-from mavis.validate.call import _call_interval_by_flanking_coverage
+from mavis.validate.call import (
+    _call_interval_by_flanking_coverage,
+    available_pairs,
+    discard_consumed_pairs,
+    filter_consumed_pairs,
+    index_pairs_by_read,
+)
 from mavis.validate.evidence import GenomeEvidence
 from mavis.validate.base import Evidence
 from mavis.interval import Interval
@@ -69,3 +77,17 @@ class TestDistanceAndTraverse(unittest.TestCase):
 
     def test_traverse_left(self):
         self.assertEqual(Interval(10), Evidence.traverse(20, 10, ORIENT.LEFT))
+
+
+class TestDiscardConsumedPairs(unittest.TestCase):
+    def test_matches_filter_consumed_pairs(self):
+        pairs = [(1, 2), (3, 4), (5, 6), (2, 7)]
+        pairs_by_read = index_pairs_by_read(pairs)
+        available = np.ones(len(pairs), dtype=bool)
+        discard_consumed_pairs(available, pairs_by_read, {2})
+        self.assertEqual(filter_consumed_pairs(pairs, {2}), set(available_pairs(pairs, available)))
+        discard_consumed_pairs(available, pairs_by_read, {6, 8})
+        self.assertEqual(
+            filter_consumed_pairs(pairs, {2, 6, 8}), set(available_pairs(pairs, available))
+        )
+        self.assertEqual([(3, 4)], available_pairs(pairs, available))
@@ -1,7 +1,20 @@
 import os
 
+from mavis.annotate.file_io import load_reference_genome
+
 DATA_DIR = os.path.join(os.path.dirname(__file__), 'data')
+_MOCK_REFERENCE_GENOME = None
 
 
 def get_data(*paths):
     return os.path.join(DATA_DIR, *paths)
+
+
+def get_mock_reference_genome():
+    """
+    the mock reference genome, parsed once and shared by all the test modules which use it
+    """
+    global _MOCK_REFERENCE_GENOME
+    if _MOCK_REFERENCE_GENOME is None:
+        _MOCK_REFERENCE_GENOME = load_reference_genome(get_data('mock_reference_genome.fa'))
+    return _MOCK_REFERENCE_GENOME